@@ -26,10 +26,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 
 
-from PyQt5.QtWidgets import QApplication
-
 from pisameet import logger
-from pisameet.gui import SlideShow
 from pisameet.options import ArgumentParser
 
 PARSER = ArgumentParser()
@@ -42,6 +39,11 @@ PARSER.add_datetime()
 
 if __name__ == '__main__':
     args = PARSER.parse_args()
+    # The Qt-related imports are deferred to here, so that we do not pay for them
+    # when the script is only invoked, e.g., with --help.
+    # pylint: disable=import-outside-toplevel
+    from PyQt5.QtWidgets import QApplication
+    from pisameet.gui import SlideShow
     app = QApplication(sys.argv)
     kwargs = args.__dict__
     # Determine the appropriate poster width from the screen size unless this is
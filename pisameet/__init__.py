@@ -22,7 +22,6 @@
 
 import logging
 import os
-import shutil
 import sys
 
 #
@@ -42,49 +41,68 @@ MISSING_QRCODE_PATH = os.path.join(PISAMEET_GRAPHICS, 'unknown_qrcode.png')
 MAGIC_FILE_PATH = os.path.join(PISAMEET_BASE, '.reload')
 
 
+# ANSI escape sequences for printing text in colors.
+_HEADER = '\033[95m'
+_BLUE = '\033[94m'
+_GREEN = '\033[92m'
+_YELLOW = '\033[93m'
+_RED = '\033[91m'
+_ENDC = '\033[0m'
+_BOLD = '\033[1m'
+_UNDERLINE = '\033[4m'
+
+
+def red(text):
+    """Process a piece of text to be printed out in red.
+    """
+    return f'{_RED}{text}{_ENDC}'
+
+
+def yellow(text):
+    """Process a piece of text to be printed out in yellow.
+    """
+    return f'{_YELLOW}{text}{_ENDC}'
+
+
+def green(text):
+    """Process a piece of text to be printed out in green.
+    """
+    return f'{_GREEN}{text}{_ENDC}'
+
+
+
 class TerminalColors:
 
     """Terminal facilities for printing text in colors.
+
+    This is only kept for backward compatibility, and forwards everything to
+    the module-level constants and functions.
     """
 
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+    HEADER = _HEADER
+    BLUE = _BLUE
+    GREEN = _GREEN
+    YELLOW = _YELLOW
+    RED = _RED
+    ENDC = _ENDC
+    BOLD = _BOLD
+    UNDERLINE = _UNDERLINE
 
     @staticmethod
     def _color(text, color):
         """Process a piece of tect to be printed out in color.
         """
-        return '%s%s%s' % (color, text, TerminalColors.ENDC)
+        return f'{color}{text}{_ENDC}'
 
-    @staticmethod
-    def red(text):
-        """Process a piece of text to be printed out in red.
-        """
-        return TerminalColors._color(text, TerminalColors.RED)
-
-    @staticmethod
-    def yellow(text):
-        """Process a piece of text to be printed out in yellow.
-        """
-        return TerminalColors._color(text, TerminalColors.YELLOW)
-
-    @staticmethod
-    def green(text):
-        """Process a piece of text to be printed out in green.
-        """
-        return TerminalColors._color(text, TerminalColors.GREEN)
+    red = staticmethod(red)
+    yellow = staticmethod(yellow)
+    green = staticmethod(green)
 
 
 def abort(msg=''):
     """Abort the execution of the program.
     """
-    sys.exit(TerminalColors.red(f'Abort: {msg}'))
+    sys.exit(red(f'Abort: {msg}'))
 
 
 
@@ -93,16 +111,20 @@ class TerminalFormatter(logging.Formatter):
     """Logging terminal formatter class.
     """
 
+    # Color prefix and suffix for the relevant logging levels.
+    _LEVEL_WRAP = {
+        logging.CRITICAL: (_RED, _ENDC),
+        logging.ERROR: (_RED, _ENDC),
+        logging.WARNING: (_YELLOW, _ENDC)
+    }
+
     def format(self, record):
         """Overloaded format method.
         """
-        text = ('>>> %s' % record.msg)
-        if len(record.args) > 0:
-            text = text % record.args
-        if record.levelno >= logging.ERROR:
-            text = TerminalColors.red(text)
-        elif record.levelno == logging.WARNING:
-            text = TerminalColors.yellow(text)
+        text = f'>>> {record.getMessage()}'
+        wrap = self._LEVEL_WRAP.get(record.levelno)
+        if wrap is not None:
+            return f'{wrap[0]}{text}{wrap[1]}'
         return text
 
 
@@ -118,16 +140,30 @@ logger.addHandler(console_handler)
 # Relevant files for setting up the screen ID.
 _SCREEN_ID_FILE_PATH = os.path.join(PISAMEET_ROOT, 'screen.cfg')
 _SAMPLE_SCREEN_ID_FILE_PATH = os.path.join(PISAMEET_ROOT, 'screen.cfg.sample')
+# Cached value of the screen identifier.
+_SCREEN_ID = None
 
 
 def copy_screen_id_sample_file():
     """Copy the sample configuration file with the screen identifier to the
     proper location, for it to be manually edited.
+
+    Note that the sample file is tiny, and we simply read it in memory and
+    write it out in one go. (We do not hard-link the two files, as the
+    configuration file is typically overwritten in place, e.g., by
+    script/setscreen.sh, and that would leak into the sample file.)
+
+    Returns the content of the file, so that the caller does not need to read
+    it back.
     """
     src = _SAMPLE_SCREEN_ID_FILE_PATH
     dest = _SCREEN_ID_FILE_PATH
     logger.info('Copying %s to %s...', src, dest)
-    shutil.copyfile(src, dest)
+    with open(src, 'rb') as input_file:
+        data = input_file.read()
+    with open(dest, 'wb') as output_file:
+        output_file.write(data)
+    return data
 
 
 def read_screen_id():
@@ -136,14 +172,22 @@ def read_screen_id():
     Note that if the proper text files does not exists, a copy from a sample
     file will be created, for the user to edit it by hand.
     (The configuration file is included in the .gitignore file.)
+
+    The value is cached, so that the file is only read at the first call.
     """
-    if not os.path.exists(_SCREEN_ID_FILE_PATH):
-        copy_screen_id_sample_file()
-    logger.info('Reading tyeh screen identifier from %s...', _SCREEN_ID_FILE_PATH)
-    with open(_SCREEN_ID_FILE_PATH) as input_file:
-        screen_id = int(input_file.read())
-    logger.info('Local screen identifier: %d', screen_id)
-    return screen_id
+    # pylint: disable=global-statement
+    global _SCREEN_ID
+    if _SCREEN_ID is not None:
+        return _SCREEN_ID
+    logger.info('Reading the screen identifier from %s...', _SCREEN_ID_FILE_PATH)
+    try:
+        with open(_SCREEN_ID_FILE_PATH, 'rb') as input_file:
+            data = input_file.read()
+    except FileNotFoundError:
+        data = copy_screen_id_sample_file()
+    _SCREEN_ID = int(data.strip())
+    logger.info('Local screen identifier: %d', _SCREEN_ID)
+    return _SCREEN_ID
 
 
 def read_magic_file():
@@ -20,31 +20,174 @@ This module contains the facilities to dispatch all the relevant files from the
 dump of the indico attachments to the folder structure in use by the slideshow.
 """
 
+import atexit
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import mmap
 import os
+import pathlib
+import re
 import shutil
 
-import pdfrw
+from . import logger, PISAMEET_DATA
 
-from . import logger
+
+# Persistent cache of the pdf_info() output, indexed by path, mtime and size.
+_PDF_INFO_CACHE_PATH = os.path.join(PISAMEET_DATA, '.pdfinfo_cache.json')
+_pdf_info_cache = None
+_pdf_info_cache_dirty = False
+
+# Regular expressions for the fast, byte-level scan of pdf files.
+_MEDIABOX_RE = re.compile(rb'/MediaBox\s*\[\s*([\d.\-]+)\s+([\d.\-]+)\s+([\d.\-]+)\s+([\d.\-]+)\s*\]')
+# Note this matches a whole (non-nested) <<...>> dictionary containing /Type/Pages,
+# independently of the order of the keys.
+_PAGES_DICT_RE = re.compile(rb'<<((?:(?!<<|>>).)*?/Type\s*/Pages\b(?:(?!<<|>>).)*)>>', re.DOTALL)
+_COUNT_RE = re.compile(rb'/Count\s+(\d+)')
+_PARENT_RE = re.compile(rb'/Parent\s')
+
+# Number of worker threads for the (I/O-bound) file inspection and copy.
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Chunk size for the in-kernel file copy.
+_COPY_CHUNK_SIZE = 1 << 20
+
+# Regular expressions matching the names of the indico attachments, e.g.,
+# 123-poster.pdf, and capturing the contribution identifier.
+_POSTER_NAME_RE = re.compile(r'^(\d+)-.*\.pdf$')
+_PIC_NAME_RE = re.compile(r'^(\d+)-.*\.(png|jpe?g)$', re.IGNORECASE)
+
+
+def _load_pdf_info_cache():
+    """Load the pdf_info() cache from disk (this is done lazily at the first call).
+    """
+    # pylint: disable=global-statement, broad-except
+    global _pdf_info_cache
+    _pdf_info_cache = {}
+    if os.path.exists(_PDF_INFO_CACHE_PATH):
+        logger.debug('Loading pdf info cache from %s...', _PDF_INFO_CACHE_PATH)
+        try:
+            with open(_PDF_INFO_CACHE_PATH) as input_file:
+                _pdf_info_cache = json.load(input_file)
+        except Exception as exception:
+            logger.warning('Could not read %s: %s', _PDF_INFO_CACHE_PATH, exception)
+    atexit.register(_dump_pdf_info_cache)
+
+
+def _dump_pdf_info_cache():
+    """Write the pdf_info() cache back to disk, if anything changed.
+    """
+    if not _pdf_info_cache_dirty:
+        return
+    logger.debug('Writing pdf info cache to %s...', _PDF_INFO_CACHE_PATH)
+    with open(_PDF_INFO_CACHE_PATH, 'w') as output_file:
+        json.dump(_pdf_info_cache, output_file)
 
 
 def pdf_info(file_path: str):
     """Peek at a pdf file and retrieve some of its basic properties, e.g., the
     number of pages and the aspect ratio, useful to decide whether it is a poster or not.
 
+    The results are cached on disk, keyed by the file path, modification time
+    and size, so that unchanged files are not parsed again at the next run.
+
+    Note that, since only single-page documents can be posters, the aspect ratio
+    is not calculated (and None is returned) for multi-page documents.
+
     Arguments
     ---------
     file_path : str
         Path to the input pdf file.
     """
-    # pylint: disable=broad-except
+    # pylint: disable=global-statement
+    global _pdf_info_cache_dirty
     assert file_path.endswith('.pdf')
+    if _pdf_info_cache is None:
+        _load_pdf_info_cache()
+    stat = os.stat(file_path)
+    key = f'{file_path}:{stat.st_mtime_ns}:{stat.st_size}'
+    if key in _pdf_info_cache:
+        return tuple(_pdf_info_cache[key])
+    info = _parse_pdf_info(file_path)
+    _pdf_info_cache[key] = info
+    _pdf_info_cache_dirty = True
+    return info
+
+
+def _scan_pdf_info(file_path: str):
+    """Scan the raw bytes of a pdf file looking for the page count and the
+    media box, without building the full object tree.
+
+    Note this returns (None, None) whenever the information cannot be located
+    unambiguously---i.e., unless we find exactly one root of the page tree (a
+    /Type/Pages dictionary with no /Parent) and exactly one media box. This
+    covers, e.g., the case of objects living in compressed object streams,
+    incrementally updated files and page trees with inherited boxes, in which
+    case the caller should fall back to a proper parser.
+
+    Arguments
+    ---------
+    file_path : str
+        Path to the input pdf file.
+    """
+    with open(file_path, 'rb') as input_file:
+        try:
+            data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # This is what happens with empty files.
+            return None, None
+        with data:
+            roots = [match.group(1) for match in _PAGES_DICT_RE.finditer(data) \
+                if _PARENT_RE.search(match.group(1)) is None]
+            if len(roots) != 1:
+                return None, None
+            count = _COUNT_RE.search(roots[0])
+            if count is None:
+                return None, None
+            num_pages = int(count.group(1))
+            if num_pages != 1:
+                return num_pages, None
+            boxes = _MEDIABOX_RE.findall(data)
+            if len(boxes) != 1:
+                return None, None
+            try:
+                box = [float(val) for val in boxes[0]]
+            except ValueError:
+                return None, None
+    if box[3] == 0:
+        return None, None
+    return num_pages, box[2] / box[3]
+
+
+def _parse_pdf_info(file_path: str):
+    """Parse a pdf file and return the number of pages and the aspect ratio of
+    the first page (this is the actual workhorse for pdf_info()).
+
+    We try a cheap byte-level scan first, and only resort to a full parsing
+    with pdfrw if that fails.
+
+    Arguments
+    ---------
+    file_path : str
+        Path to the input pdf file.
+    """
+    num_pages, aspect_ratio = _scan_pdf_info(file_path)
+    if num_pages is not None:
+        return num_pages, aspect_ratio
+    # pdfrw is imported here (and not at the module level), so that we do not pay
+    # the import cost when the fast scan succeeds.
+    # pylint: disable=broad-except, import-outside-toplevel
+    import pdfrw
     try:
-        pdf = pdfrw.PdfReader(file_path)
+        # Read the whole file in one go, rather than going through the small
+        # default buffer of the file object that pdfrw would be using.
+        pdf = pdfrw.PdfReader(fdata=pathlib.Path(file_path).read_bytes())
     except Exception as exception:
         logger.error('Parsing error for %s: %s', file_path, exception)
         return None, None
     num_pages = len(pdf.pages)
+    if num_pages != 1:
+        return num_pages, None
     box = pdf.pages[0].MediaBox or pdf.pages[0].Parent.MediaBox
     if box is None:
         logger.warning('No media box for %s...', file_path)
@@ -59,59 +202,157 @@ def pdf_info(file_path: str):
 def poster_candidates(file_list):
     """Filter an input list of file paths and return the subset of those that
     might legitimately point to actual posters.
+
+    The pdf files are inspected in parallel by a pool of worker threads.
     """
+    pdf_files = [file_path for file_path in file_list if file_path.endswith('.pdf')]
+    # Make sure the cache is loaded before we fire up the worker threads.
+    if _pdf_info_cache is None:
+        _load_pdf_info_cache()
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        results = list(executor.map(pdf_info, pdf_files))
     candidates = []
-    for file_path in file_list:
-        if file_path.endswith('.pdf'):
-            num_pages, aspect_ratio = pdf_info(file_path)
-            if num_pages == 1 and aspect_ratio is not None and aspect_ratio < 1:
-                candidates.append(file_path)
+    for file_path, (num_pages, aspect_ratio) in zip(pdf_files, results):
+        if num_pages == 1 and aspect_ratio is not None and aspect_ratio < 1:
+            candidates.append(file_path)
     return candidates
 
 
-def dispatch_posters(contribution_ids, src_folder_path, dest_folder_path):
-    """Dispatch the candidate poster files from the indico attachment folder to
-    the target folder holding the poster originals.
+def _kernel_copy(src, dest, use_sendfile=False, chunk_size=_COPY_CHUNK_SIZE):
+    """Copy a file without moving the data through user space, using either
+    os.copy_file_range() or os.sendfile().
+
+    Note this raises an AttributeError if the underlying system call is not
+    available on the platform, or an OSError if the copy fails (including the
+    case where the system call stops short of the size of the source file).
     """
-    file_dict = {id_: [] for id_ in contribution_ids}
-    for file_name in os.listdir(src_folder_path):
-        if not file_name.endswith('.pdf'):
-            continue
-        id_ = int(file_name.split('-')[0])
-        if id_ in file_dict:
-            file_dict[id_].append(os.path.join(src_folder_path, file_name))
-    for id_, attachments in file_dict.items():
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dest_fd = os.open(dest, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = os.fstat(src_fd).st_size
+            offset = 0
+            while offset < size:
+                if use_sendfile:
+                    num_bytes = os.sendfile(dest_fd, src_fd, offset, chunk_size)
+                else:
+                    num_bytes = os.copy_file_range(src_fd, dest_fd, chunk_size)
+                if num_bytes == 0:
+                    break
+                offset += num_bytes
+            # A premature end of file would leave a silently truncated copy behind.
+            if offset < size:
+                raise OSError(f'Short copy of {src} ({offset} of {size} bytes)')
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _fast_copy(src, dest):
+    """Copy a file using the fastest method available.
+
+    We try os.copy_file_range() first (which might even result in a reflink on
+    copy-on-write filesystems), then os.sendfile() and, as a last resort,
+    the plain shutil.copyfile().
+    """
+    for use_sendfile in (False, True):
+        try:
+            _kernel_copy(src, dest, use_sendfile)
+            return
+        except (AttributeError, OSError) as exception:
+            logger.debug('In-kernel copy failed for %s (%s)...', src, exception)
+    shutil.copyfile(src, dest)
+
+
+def _copy_files(copy_list):
+    """Copy a list of (src, dest) file pairs using a pool of worker threads.
+    """
+    def _copy(args):
+        src, dest = args
+        logger.info('Copying over %s to %s...', src, dest)
+        _fast_copy(src, dest)
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        list(executor.map(_copy, copy_list))
+
+
+def _scan_attachments(contribution_ids, src_folder_path):
+    """Scan the indico attachment folder (once) and sort the files into two
+    dictionaries of lists of poster and picture candidates, respectively,
+    indexed by contribution identifier.
+
+    Note that contributions with no attachments do not appear in the output
+    dictionaries at all.
+    """
+    contribution_ids = set(contribution_ids)
+    poster_dict = defaultdict(list)
+    picture_dict = defaultdict(list)
+    with os.scandir(src_folder_path) as entries:
+        for entry in entries:
+            for pattern, file_dict in ((_POSTER_NAME_RE, poster_dict), (_PIC_NAME_RE, picture_dict)):
+                match = pattern.match(entry.name)
+                if match is not None:
+                    id_ = int(match.group(1))
+                    if id_ in contribution_ids:
+                        file_dict[id_].append(entry.path)
+                    break
+    return poster_dict, picture_dict
+
+
+def _existing_files(folder_path):
+    """Return the set of the names of the files already in a given folder.
+
+    This is used to skip the files that have been already dispatched without
+    having to stat each target path separately.
+    """
+    try:
+        return set(os.listdir(folder_path))
+    except FileNotFoundError:
+        return set()
+
+
+def _dispatch_poster_files(contribution_ids, file_dict, dest_folder_path):
+    """Dispatch the poster files from a dictionary of lists of attachments,
+    indexed by contribution identifier.
+    """
+    # Inspect all the attachments in one go, in order to take full advantage
+    # of the thread pool.
+    file_list = [file_path for attachments in file_dict.values() for file_path in attachments]
+    all_candidates = set(poster_candidates(file_list))
+    existing = _existing_files(dest_folder_path)
+    copy_list = []
+    for id_ in contribution_ids:
+        attachments = file_dict.get(id_, ())
         if len(attachments) == 0:
             logger.error('No poster candidate found for contribution %d', id_)
             continue
-        candidates = poster_candidates(attachments)
+        candidates = [file_path for file_path in attachments if file_path in all_candidates]
         if len(candidates) == 1:
             logger.info('Unique poster candidate found!')
             src = candidates[0]
             file_name = f'{id_:03d}.pdf'
             dest = os.path.join(dest_folder_path, file_name)
-            if os.path.exists(dest):
+            if file_name in existing:
                 logger.info('Target file %s exist, skipping...', dest)
             else:
-                logger.info('Copying over poster to %s...', dest)
-                shutil.copyfile(src, dest)
+                copy_list.append((src, dest))
+                existing.add(file_name)
         else:
             logger.warning('%d candidate posters / %d attachments for contribution %s',
                 len(candidates), len(attachments), id_)
+    _copy_files(copy_list)
 
 
-def dispatch_pictures(contribution_ids, src_folder_path, dest_folder_path):
-    """
+def _dispatch_picture_files(contribution_ids, file_dict, dest_folder_path):
+    """Dispatch the presenter pictures from a dictionary of lists of attachments,
+    indexed by contribution identifier.
     """
     logger.info('Dispatching pictures...')
-    file_dict = {id_: [] for id_ in contribution_ids}
-    for file_name in os.listdir(src_folder_path):
-        if not file_name.split('.')[-1].lower() in ('png', 'jpg', 'jpeg'):
-            continue
-        id_ = int(file_name.split('-')[0])
-        if id_ in file_dict:
-            file_dict[id_].append(os.path.join(src_folder_path, file_name))
-    for id_, attachments in file_dict.items():
+    existing = _existing_files(dest_folder_path)
+    copy_list = []
+    for id_ in contribution_ids:
+        attachments = file_dict.get(id_, ())
         if len(attachments) == 0:
             logger.error('No picture candidate found for contribution %d', id_)
             continue
@@ -121,12 +362,38 @@ def dispatch_pictures(contribution_ids, src_folder_path, dest_folder_path):
             ext = attachments[0].split('.')[-1]
             file_name = f'{id_:03d}.{ext}'
             dest = os.path.join(dest_folder_path, file_name)
-            if os.path.exists(dest):
+            if file_name in existing:
                 logger.info('Target file %s exist, skipping...', dest)
             else:
-                logger.info('Copying over poster to %s...', dest)
-                shutil.copyfile(src, dest)
+                copy_list.append((src, dest))
+                existing.add(file_name)
         else:
             logger.warning('%d candidate pictures found for contribution %d...',
                 len(attachments), id_)
+    _copy_files(copy_list)
     logger.info('Done.')
+
+
+def dispatch_posters(contribution_ids, src_folder_path, dest_folder_path):
+    """Dispatch the candidate poster files from the indico attachment folder to
+    the target folder holding the poster originals.
+    """
+    poster_dict, _ = _scan_attachments(contribution_ids, src_folder_path)
+    _dispatch_poster_files(contribution_ids, poster_dict, dest_folder_path)
+
+
+def dispatch_pictures(contribution_ids, src_folder_path, dest_folder_path):
+    """Dispatch the presenter pictures from the indico attachment folder to
+    the target folder holding the picture originals.
+    """
+    _, picture_dict = _scan_attachments(contribution_ids, src_folder_path)
+    _dispatch_picture_files(contribution_ids, picture_dict, dest_folder_path)
+
+
+def dispatch_all(contribution_ids, src_folder_path, poster_folder_path, picture_folder_path):
+    """Dispatch both the posters and the presenter pictures, with a single pass
+    over the indico attachment folder.
+    """
+    poster_dict, picture_dict = _scan_attachments(contribution_ids, src_folder_path)
+    _dispatch_poster_files(contribution_ids, poster_dict, poster_folder_path)
+    _dispatch_picture_files(contribution_ids, picture_dict, picture_folder_path)
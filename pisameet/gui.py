@@ -19,19 +19,21 @@
 This module contains all the widgets that are relevant for the slideshow.
 """
 
+from collections import OrderedDict
 import datetime
 from enum import Enum, IntEnum, auto
 import os
 import time
 
-import pandas as pd
 # pylint: disable=no-name-in-module, too-many-instance-attributes
 from PyQt5.QtWidgets import QLabel, QGridLayout, QWidget, QGraphicsOpacityEffect,\
-    QTableWidget, QTableWidgetItem, QHeaderView, QTreeWidget, QTreeWidgetItem
-from PyQt5.QtGui import QKeyEvent, QColor, QFont
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+    QTableView, QHeaderView, QTreeView
+from PyQt5.QtGui import QKeyEvent, QBrush, QColor, QFont, QFontMetrics, QPixmapCache
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QAbstractItemModel, QAbstractTableModel,\
+    QModelIndex, QObject, QPropertyAnimation, QRunnable, QThread, QThreadPool
 
 from pisameet import logger, abort, read_screen_id, read_magic_file
+from pisameet.options import DisplayMode
 from pisameet.profile import psstatus
 from pisameet.program import Poster, PosterRoster, PosterProgram, DATE_FORMAT,\
     DATE_PRETTY_FORMAT, DATETIME_FORMAT
@@ -44,8 +46,8 @@ class FadingEffect(QGraphicsOpacityEffect):
 
     This is simple graphic effect allowing a fade-in/out effect to a gradual
     change in the opacity. Internally, the transitions are controlled via a
-    QTimer() object increasing or decreasing the opacity by a fixed amount
-    (the _step class member) at each timeout.
+    QPropertyAnimation object acting on the opacity property, so that the
+    interpolation (and the corresponding repaints) are entirely handled by Qt.
 
     Arguments
     ---------
@@ -54,6 +56,9 @@ class FadingEffect(QGraphicsOpacityEffect):
 
     interval : int
         The basic time interval (in ms) during the transitions.
+
+    (The step and interval only serve to define the overall duration of the
+    transitions, see the fade_time() method.)
     """
 
     def __init__(self, step: float = 0.025, interval: int = 5):
@@ -63,8 +68,8 @@ class FadingEffect(QGraphicsOpacityEffect):
         self.setOpacity(1.)
         self._step = step
         self._interval = interval
-        self._timer = QTimer()
-        self._timer.start(self._interval)
+        self._animation = QPropertyAnimation(self, b'opacity')
+        self._animation.setDuration(int(round(1.e3 * self.fade_time())))
         logger.debug('Opacity fade time set to %.3f s', self.fade_time())
 
     def fade_time(self):
@@ -73,51 +78,206 @@ class FadingEffect(QGraphicsOpacityEffect):
         """
         return 1.e-3 * self._interval / self._step
 
-    def _decrease_opacity(self):
-        """Decrease the opacity by one step.
-
-        Since this is typically controlled by the underlying QTimer object, when
-        the opacity reaches (or crosses) zero the timer is disconnected from all
-        the slots, and the opacity is set to 0 (fully opaque).
-        """
-        opacity = self.opacity() - self._step
-        if opacity <= 0.:
-            self._timer.disconnect()
-            self.setOpacity(0.)
-        self.setOpacity(opacity)
-
-    def _increase_opacity(self):
-        """Increase the opacity by one step.
-
-        Since this is typically controlled by the underlying QTimer object, when
-        the opacity reaches (or crosses) one the timer is disconnected from all
-        the slots, and the opacity is set to 1 (fully transparent).
+    def _animate(self, start_value: float, end_value: float):
+        """Start an opacity transition between two given values.
         """
-        opacity = self.opacity() + self._step
-        if opacity >= 1.:
-            self._timer.disconnect()
-            self.setOpacity(1.)
-        self.setOpacity(opacity)
+        self._animation.stop()
+        self._animation.setStartValue(start_value)
+        self._animation.setEndValue(end_value)
+        self._animation.start()
 
     def fade_in(self, start_from_zero=True):
         """Fade in effect, i.e., gradually change opacity to 1.
         """
-        if start_from_zero:
-            self.setOpacity(0.)
-        self._timer.timeout.connect(self._increase_opacity)
+        self._animate(0. if start_from_zero else self.opacity(), 1.)
 
     def fade_out(self, start_from_one=True):
         """Fade in effect, i.e., gradually change opacity to 0.
         """
-        if start_from_one:
-            self.setOpacity(1.)
-        self._timer.timeout.connect(self._decrease_opacity)
+        self._animate(1. if start_from_one else self.opacity(), 0.)
+
+
+
+class CountdownTimer(QTimer):
+
+    """Small QTimer subclass keeping track of its own deadline on the monotonic
+    clock.
+
+    This allows to calculate the time remaining to the next timeout (e.g., for
+    the countdowns in the status messages) with no call into Qt. Note the
+    deadline is updated when the timer is (re)started or stopped, as well as
+    at each timeout, for the repeating timers.
+    """
+
+    def __init__(self) -> None:
+        """Constructor.
+        """
+        super().__init__()
+        self._deadline = None
+        # Mind this is the very first connection, so that the deadline is
+        # updated before any other slot is called.
+        self.timeout.connect(self._update_deadline)
+
+    def _update_deadline(self):
+        """Update the deadline at timeout.
+        """
+        if self.isSingleShot():
+            self._deadline = None
+        else:
+            self._deadline = time.monotonic() + 1.e-3 * self.interval()
+
+    def start(self, *args):
+        """Overloaded method.
+        """
+        super().start(*args)
+        self._deadline = time.monotonic() + 1.e-3 * self.interval()
+
+    def stop(self):
+        """Overloaded method.
+        """
+        super().stop()
+        self._deadline = None
+
+    def remaining_seconds(self) -> float:
+        """Return the number of seconds remaining to the next timeout (or zero
+        if the timer is not active).
+        """
+        if self._deadline is None:
+            return 0.
+        return max(self._deadline - time.monotonic(), 0.)
+
+
+
+class RosterTableModel(QAbstractTableModel):
+
+    """Table model exposing a list of posters to a RosterTable view.
+
+    The model does not hold any item object---all the cell contents are
+    generated on the fly, in the data() method, from the underlying Poster
+    objects. Highlighting a row is only a matter of updating an integer and
+    signaling that the old and new rows have changed.
+
+    Arguments
+    ---------
+    default_color : QColor
+        The default (i.e., not highlighted) foreground color.
+
+    highlight_color : QColor
+        The foreground color for the highlighted row.
+
+    (The two colors are wrapped into QBrush objects once and for all, so that
+    the views do not need to create a brush each time a cell is painted.)
+
+    title_length : int
+        The maximum length of the poster titles.
+    """
+
+    NUM_COLUMNS = 3
+
+    def __init__(self, default_color: QColor, highlight_color: QColor, title_length: int = 65):
+        """Constructor.
+        """
+        super().__init__()
+        self._default_brush = QBrush(default_color)
+        self._highlight_brush = QBrush(highlight_color)
+        self._title_length = title_length
+        self._posters = []
+        self._highlighted_row = None
+
+    def rowCount(self, parent=QModelIndex()):
+        """Overloaded method.
+        """
+        # pylint: disable=invalid-name
+        if parent.isValid():
+            return 0
+        return len(self._posters)
+
+    def columnCount(self, parent=QModelIndex()):
+        """Overloaded method.
+        """
+        # pylint: disable=invalid-name
+        if parent.isValid():
+            return 0
+        return self.NUM_COLUMNS
+
+    def _cell_text(self, poster: Poster, col: int) -> str:
+        """Return the text to be displayed in a given column for a given poster.
+        """
+        if col == 0:
+            return f'[{poster.friendly_id}]'
+        if col == 1:
+            return poster.short_title(self._title_length)
+        return f'{poster.presenter.full_name()}'
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Overloaded method.
+        """
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._cell_text(self._posters[row], index.column())
+        if role == Qt.ForegroundRole:
+            if row == self._highlighted_row:
+                return self._highlight_brush
+            return self._default_brush
+        return None
+
+    def set_posters(self, posters):
+        """Set the list of posters to be displayed.
 
+        Arguments
+        ---------
+        posters : sequence of program.Poster objects
+            The posters to be displayed in the table (e.g., a PosterRoster).
+        """
+        self.beginResetModel()
+        self._posters = posters
+        self._highlighted_row = None
+        self.endResetModel()
 
+    def set_poster(self, row: int, poster: Poster):
+        """Replace the poster on a given row, in place.
 
-class RosterTable(QTableWidget):
+        Note this modifies the underlying sequence of posters, and is only meant
+        to be used on lists owned by the caller.
 
-    """Custom QTableWidget to display a poster roster.
+        Arguments
+        ---------
+        row : int
+            The row identifier.
+
+        poster : program.Poster object
+            The poster to be displayed on the row.
+        """
+        self._posters[row] = poster
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.NUM_COLUMNS - 1),
+            [Qt.DisplayRole])
+
+    def _emit_row_changed(self, row: int):
+        """Signal that the foreground of a given row has changed.
+        """
+        if row is not None and 0 <= row < len(self._posters):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.NUM_COLUMNS - 1),
+                [Qt.ForegroundRole])
+
+    def set_current_row(self, row: int):
+        """Highlight a given row.
+
+        Arguments
+        ---------
+        row : int
+            The row identifier.
+        """
+        old_row, self._highlighted_row = self._highlighted_row, row
+        self._emit_row_changed(old_row)
+        self._emit_row_changed(row)
+
+
+
+class RosterTable(QTableView):
+
+    """Custom QTableView to display a poster roster.
 
     In addition to the basic functionality of the base class, this is designed
     to highlight one row at a time (e.g., by setting a different color) in
@@ -131,14 +291,22 @@ class RosterTable(QTableWidget):
     default_rgb : int
         The default value of the three RGB channels for the default
         (i.e., not highlighted) color.
+
+    title_length : int
+        The maximum length of the poster titles.
+
+    padding : int
+        The horizontal padding (in pixels) for the fixed-width columns.
     """
 
     def __init__(self, height: int, row_height: int = 26,
-        default_rgb: int = 175):
+        default_rgb: int = 175, title_length: int = 65, padding: int = 10):
         """Constructor,
         """
         super().__init__()
-        self.setColumnCount(3)
+        self._model = RosterTableModel(QColor(default_rgb, default_rgb, default_rgb),
+            QColor(0, 0, 0), title_length)
+        self.setModel(self._model)
         self.horizontalHeader().hide()
         self.verticalHeader().hide()
         self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
@@ -146,36 +314,30 @@ class RosterTable(QTableWidget):
         self.verticalHeader().setDefaultSectionSize(row_height)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setShowGrid(False)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Note the column widths are calculated once and for all based on the
+        # font metrics, rather than resizing to the contents, which would
+        # require measuring the text of each and every cell.
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.horizontalHeader().setStretchLastSection(True)
+        metrics = QFontMetrics(self.font())
+        self.setColumnWidth(0, metrics.horizontalAdvance('[999]') + padding)
+        self.setColumnWidth(1, metrics.averageCharWidth() * title_length + padding)
         self.setStyleSheet("border: 0px")
         self.setEnabled(False)
         self.setMaximumHeight(height)
-        self._default_color = QColor(default_rgb, default_rgb, default_rgb)
-        self._highlight_color = QColor(0, 0, 0)
-        self._highlighted_row = None
 
-    def set_text(self, row: int, col: int, text: str):
-        """Set the text for a given cell.
-
-        Note the item is rendered with the default foreground color upon insertion.
+    def set_roster(self, roster):
+        """Populate the entire table with a poster roster.
 
         Arguments
         ---------
-        row : int
-            The row identifier.
-
-        col : int
-            The column identifier.
-
-        text : str
-            The text to be displayed.
+        roster : PosterRoster (or any sequence of program.Poster objects)
+            The poster roster to be displayed in the table.
         """
-        item = QTableWidgetItem(text)
-        item.setForeground(self._default_color)
-        self.setItem(row, col, item)
+        self._model.set_posters(roster)
 
-    def set_poster(self, row: int, poster: Poster, title_length=65):
-        """Populate a given row with the poster information.
+    def set_poster(self, row: int, poster: Poster):
+        """Replace the poster on a given row, in place.
 
         Arguments
         ---------
@@ -183,24 +345,9 @@ class RosterTable(QTableWidget):
             The row identifier.
 
         poster : program.Poster object
-            The poster to be displayed on a given row.
-        """
-        self.set_text(row, 0, f'[{poster.friendly_id}]')
-        self.set_text(row, 1, f'{poster.short_title(title_length)}'.ljust(title_length))
-        self.set_text(row, 2, f'{poster.presenter.full_name()}')
-
-    def set_roster(self, roster: PosterRoster):
-        """Populate the entire table with a poster roster.
-
-        Arguments
-        ---------
-        roster : PosterRoster
-            The poster roster to be displayed in the table.
+            The poster to be displayed on the row.
         """
-        self.clear()
-        self.setRowCount(len(roster))
-        for row, poster in enumerate(roster):
-            self.set_poster(row, poster)
+        self._model.set_poster(row, poster)
 
     def set_current_row(self, row: int):
         """Highlight a given row.
@@ -210,14 +357,12 @@ class RosterTable(QTableWidget):
         row : int
             The row identifier.
         """
-        for col in range(self.columnCount()):
-            if self._highlighted_row is not None:
-                try:
-                    self.item(self._highlighted_row, col).setForeground(self._default_color)
-                except AttributeError:
-                    logger.warning(f'Could not highlight row {self._highlighted_row, col}')
-            self.item(row, col).setForeground(self._highlight_color)
-        self._highlighted_row = row
+        self._model.set_current_row(row)
+
+    def clear(self):
+        """Clear the table.
+        """
+        self._model.set_posters([])
 
 
 
@@ -260,6 +405,7 @@ class ScreenHeaderMinimal(QWidget):
         # ... and the status message label.
         self.status_label = QLabel()
         self.status_label.setAlignment(Qt.AlignTop)
+        self._status_text = None
         # Setup the payout.
         self._setup_layout()
         # And freeze the height of the last column to add a minimum space between
@@ -280,7 +426,13 @@ class ScreenHeaderMinimal(QWidget):
 
     def set_status(self, text):
         """Set the status text label.
+
+        Note that the label is only touched if the text has actually changed, so
+        that we do not trigger a relayout and repaint for nothing.
         """
+        if text == self._status_text:
+            return
+        self._status_text = text
         text = f'<font color="white" size="4">F</font><br/>'\
                f'<font color="black" size="2">{text}</font><br/>'
         self.status_label.setText(text)
@@ -288,6 +440,7 @@ class ScreenHeaderMinimal(QWidget):
     def clear(self):
         """Clear the header.
         """
+        self._status_text = None
         self.status_label.setText('')
 
 
@@ -323,9 +476,11 @@ class ScreenHeader(ScreenHeaderMinimal):
         self.presenter_label = QLabel()
         self.presenter_label.setWordWrap(True)
         self.presenter_label.setAlignment(Qt.AlignTop)
+        self._presenter_text = None
         # ... the poster roster table...
         self.table = RosterTable(portrait_height)
         self._roster = None
+        self._current_poster_id = None
         super().__init__(title, **kwargs)
         self.setFixedHeight(height)
         if False:
@@ -354,6 +509,7 @@ class ScreenHeader(ScreenHeaderMinimal):
         """Set the poster roster for the table.
         """
         self._roster = roster
+        self._current_poster_id = None
         self.set_subtitle(self._roster.session.title)
 
     def _update_pixmaps(self, poster):
@@ -368,21 +524,34 @@ class ScreenHeader(ScreenHeaderMinimal):
         presenter = poster.presenter
         text = f'<font color="black" size="4">{presenter.full_name()}</font><br/>'\
                f'<font color="gray" size="2">{presenter.affiliation}</font><br/>'
+        # Avoid the rich-text parsing and relayout if nothing has changed.
+        if text == self._presenter_text:
+            return
+        self._presenter_text = text
         self.presenter_label.setText(text)
 
     def set_poster(self, poster):
         """Set the poster for the header.
         """
+        self._current_poster_id = None
         self._update_pixmaps(poster)
         self._update_presenter(poster)
-        self.table.clear()
-        self.table.setRowCount(1)
-        self.table.set_poster(0, poster)
+        # Reuse the one row in place, if it is there already, rather than
+        # resetting the whole table model.
+        if self._roster is None and self.table.model().rowCount() == 1:
+            self.table.set_poster(0, poster)
+        else:
+            self.table.set_roster([poster])
         self.table.set_current_row(0)
 
     def update(self, current_poster_id):
         """Update the header based on the roster information and the current poster.
+
+        Note this is a no-op if the poster is the same as the last one.
         """
+        if current_poster_id == self._current_poster_id:
+            return
+        self._current_poster_id = current_poster_id
         poster = self._roster[current_poster_id]
         self._update_pixmaps(poster)
         self._update_presenter(poster)
@@ -392,8 +561,9 @@ class ScreenHeader(ScreenHeaderMinimal):
         """Clear the header.
         """
         super().clear()
+        self._presenter_text = None
+        self._current_poster_id = None
         self.presenter_label.setText('')
-        self.status_label.setText('')
         self.table.clear()
         self.portrait_label.clear()
         self.qrcode_label.clear()
@@ -406,11 +576,21 @@ class DisplaWindowBase(QWidget):
     """
 
     DISPLAY_TYPE = None
+    # Interval (in ms) of the shared tick timer.
+    TICK_INTERVAL = 1000
+    # Number of ticks between two subsequent reload checks.
+    RELOAD_TICKS = 10
+    # The shared tick timer---this is created on demand, see tick_timer().
+    _TICK_TIMER = None
+    # Size limit (in kB) for the QPixmapCache holding the poster, presenter and
+    # QR code pixmaps---this is large enough for a dozen full-size posters.
+    PIXMAP_CACHE_LIMIT = 131072
 
     def __init__(self, header_class=ScreenHeader, **kwargs):
         """Constructor.
         """
         super().__init__()
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), self.PIXMAP_CACHE_LIMIT))
         self.setStyleSheet('background-color: "white"')
         window_title = kwargs['conference_name']
         if self.DISPLAY_TYPE is not None:
@@ -442,7 +622,7 @@ class DisplaWindowBase(QWidget):
         header_title = f'{kwargs["conference_name"]} - {kwargs["conference_location"]} - {kwargs["conference_dates"]}'
         self.header = header_class(header_title, kwargs['header_height'], kwargs['portrait_height'])
         self.poster_label = QLabel()
-        self.poster_label.setAlignment(Qt.AlignHCenter or Qt.AlignTop)
+        self.poster_label.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
         self.debug_label = QLabel()
         self.layout().addWidget(self.header, 0, 0, 1, 3)
         self.layout().addWidget(self.poster_label, 1, 0, 1, 3)
@@ -454,19 +634,51 @@ class DisplaWindowBase(QWidget):
         self.fading_effect = FadingEffect()
         if kwargs.get('fading', False):
             self.poster_label.setGraphicsEffect(self.fading_effect)
-        # Setup the timer for updating the header.
-        self.header_timer = QTimer()
-        self.header_timer.setInterval(100)
-        self.header_timer.timeout.connect(self.update_header_status)
+        # Hook up to the shared timer for the periodic updates of the header
+        # and the reload checks. (Both are disabled by default, and it is up to
+        # the derived classes to turn them on and off as needed.)
+        self._tick_count = 0
+        self._status_fn = self.status_message
+        self._header_updates_enabled = False
+        self._reload_checks_enabled = False
+        self.tick_timer().timeout.connect(self._tick)
         self.__start_time = time.time()
 
+    @staticmethod
+    def tick_timer():
+        """Return the application-wide timer driving all the low-frequency periodic
+        updates (i.e., the header status and the reload checks).
+
+        The timer is created and started at the first call. Note the status message
+        only displays an integer number of seconds, so there is no point in
+        refreshing it more often than once per second.
+        """
+        if DisplaWindowBase._TICK_TIMER is None:
+            DisplaWindowBase._TICK_TIMER = QTimer()
+            DisplaWindowBase._TICK_TIMER.setInterval(DisplaWindowBase.TICK_INTERVAL)
+            DisplaWindowBase._TICK_TIMER.start()
+        return DisplaWindowBase._TICK_TIMER
+
+    def _tick(self):
+        """Slot connected to the shared tick timer.
+        """
+        self._tick_count += 1
+        if self._header_updates_enabled:
+            self.update_header_status()
+        if self._reload_checks_enabled and self._tick_count % self.RELOAD_TICKS == 0:
+            self._check_reload()
+
+    def _check_reload(self):
+        """Do nothing hook to be reimplemented by derived classes.
+        """
+
     def _show(self):
         """Small convenience hook to display the GUI in the proper visualization
         mode, given the command-line options.
         """
-        if self.display_mode == 'maximize':
+        if self.display_mode == DisplayMode.MAXIMIZE.value:
             self.showMaximized()
-        elif self.display_mode == 'fullscreen':
+        elif self.display_mode == DisplayMode.FULLSCREEN.value:
             self.showFullScreen()
         else:
             self.show()
@@ -487,13 +699,13 @@ class DisplaWindowBase(QWidget):
     @staticmethod
     def remaining_time(timer):
         """Return a proxy for the (integer) number of seconds remaining to the
-        next trigger of a given counter.
+        next trigger of a given CountdownTimer object.
 
         There is some heuristic involved, here, as we typically want this to
         look good in a GUI field that is not refreshed too often---which is
         why we convert ms to s and add a 0.9 s offset
         """
-        return int(0.001 * timer.remainingTime() + 0.75)
+        return int(timer.remaining_seconds() + 0.75)
 
     @staticmethod
     def sec_to_msec(sec: float) -> int:
@@ -513,12 +725,13 @@ class DisplaWindowBase(QWidget):
     def update_header_status(self):
         """Update the header information.
         """
-        self.header.set_status(self.status_message())
+        self.header.set_status(self._status_fn())
 
     def status_message(self):
         """Do nothing hook to be reimplemented by derived classes.
         """
-        raise NotImplementedError
+        # pylint: disable=no-self-use
+        return ''
 
 
 
@@ -545,13 +758,56 @@ class SlideShowStatus(Enum):
 
 
 
+class RosterLoaderSignals(QObject):
+
+    """Signals for the RosterLoader class.
+
+    (QRunnable is not a QObject, and cannot define signals on its own.)
+    """
+
+    # Signal emitted, with the PosterRoster object, when the loading is done.
+    finished = pyqtSignal(object)
+
+    # Signal emitted, with the exception, when the loading failed.
+    failed = pyqtSignal(object)
+
+
+
+class RosterLoader(QRunnable):
+
+    """Runnable to parse a poster roster off the GUI thread.
+
+    The arguments are the same as the PosterRoster class.
+    """
+
+    def __init__(self, config_file_path: str, root_folder_path: str, screen_id: int,
+        display_date: str = None) -> None:
+        """Constructor.
+        """
+        super().__init__()
+        self.signals = RosterLoaderSignals()
+        self._args = (config_file_path, root_folder_path, screen_id, display_date)
+
+    def run(self):
+        """Overloaded method.
+        """
+        # pylint: disable=broad-except
+        try:
+            roster = PosterRoster(*self._args)
+        except Exception as exception:
+            self.signals.failed.emit(exception)
+            return
+        self.signals.finished.emit(roster)
+
+
+
 class SlideShow(DisplaWindowBase):
 
     """Basic slideshow class.
     """
 
     DISPLAY_TYPE = 'Slideshow'
-    VALID_KEYS = [str(key.value) for key in SlideShowKeyMap]
+    VALID_KEYS = frozenset(str(key.value) for key in SlideShowKeyMap)
     TIP = 'use the arrows to navigate the posters or the mid button to pause'
     RUNNING_MSG = f'SlideShow running, %d s to the next poster ({TIP})'
     PAUSED_MSG = f'SlideShow paused, %d s to restart ({TIP})'
@@ -566,24 +822,35 @@ class SlideShow(DisplaWindowBase):
         self.__status = SlideShowStatus.STOPPED
         self.__current_index = 0
         # Setup the timers.
-        self.advance_timer = QTimer()
+        self.advance_timer = CountdownTimer()
         self.advance_timer.setInterval(self.advance_interval)
         self.advance_timer.timeout.connect(self.advance)
-        self.resume_timer = QTimer()
+        self.resume_timer = CountdownTimer()
         self.resume_timer.setInterval(self.pause_interval)
         self.resume_timer.setSingleShot(True)
         self.resume_timer.timeout.connect(self.resume)
-        self.reload_timer = QTimer()
-        self.reload_timer.setInterval(10000)
-        self.reload_timer.timeout.connect(self._check_reload)
+        # Single-shot, zero-delay timer to coalesce header updates, so that a
+        # burst of key presses within one event-loop cycle results in a single
+        # (expensive) header update.
+        self._pending_index = None
+        self._header_update_timer = QTimer()
+        self._header_update_timer.setSingleShot(True)
+        self._header_update_timer.setInterval(0)
+        self._header_update_timer.timeout.connect(self._flush_header_update)
+        # The actual roster is loaded asynchronously, see _load_roster().
+        self.poster_roster = []
+        self._roster_loader = None
         # We're good to go!
         self._load_roster()
-        self.header_timer.start()
-        self.reload_timer.start()
+        self._header_updates_enabled = True
+        self._reload_checks_enabled = True
 
     def _check_reload(self):
         """
         """
+        # Do nothing if a roster is already being loaded.
+        if self._roster_loader is not None:
+            return
         if read_magic_file():
             self._load_roster()
             return
@@ -591,19 +858,44 @@ class SlideShow(DisplaWindowBase):
         if self.poster_roster.session is None:
             return
         if not self.poster_roster.session.ongoing():
-            logger.info(f'Session {self.poster_roster.session} is over, reloading the program...')
+            logger.info('%s is over, reloading the program...', self.poster_roster.session)
             self._load_roster()
-            logger.info(f'Current session: {self.poster_roster.session}')
 
     def _load_roster(self):
         """Load a given session from the underlying configuration file.
+
+        Note that the roster is parsed in a worker thread, and the rest of the
+        setup is carried out in the _on_roster_loaded() slot, once the worker
+        is done.
         """
+        if self._roster_loader is not None:
+            logger.info('Poster roster already being loaded...')
+            return
         logger.info('Loading poster roster...')
         self.stop()
         self.hide()
         folder_path = os.path.dirname(self.config_file_path)
-        self.poster_roster = PosterRoster(self.config_file_path, folder_path,
+        self._roster_loader = RosterLoader(self.config_file_path, folder_path,
             self.screen_id, self.display_datetime)
+        self._roster_loader.signals.finished.connect(self._on_roster_loaded)
+        self._roster_loader.signals.failed.connect(self._on_roster_failed)
+        QThreadPool.globalInstance().start(self._roster_loader)
+
+    def _on_roster_failed(self, exception):
+        """Slot called when the poster roster could not be loaded.
+        """
+        self._roster_loader = None
+        abort(f'Could not load the poster roster ({exception})')
+
+    def _on_roster_loaded(self, roster):
+        """Slot called when the poster roster has been parsed in the worker thread.
+
+        Note the pixmaps are loaded here, and not in the worker thread, since
+        QPixmap objects can only be safely created in the GUI thread.
+        """
+        self._roster_loader = None
+        self.poster_roster = roster
+        logger.info('Current session: %s', self.poster_roster.session)
         if len(self.poster_roster) == 0:
             logger.info('Displaying default poster...')
             self._show()
@@ -667,14 +959,25 @@ class SlideShow(DisplaWindowBase):
             return self.PAUSED_MSG % self.remaining_time(self.resume_timer)
         return ''
 
+    def _flush_header_update(self) -> None:
+        """Update the header with the last requested poster index.
+        """
+        if self._pending_index is not None:
+            self.header.update(self._pending_index)
+            self._pending_index = None
+
     def display_poster(self, index: int = 0) -> None:
         """Display a given poster.
+
+        Note the header update is deferred to the next event-loop cycle via the
+        corresponding single-shot timer.
         """
         try:
             self.__current_index = index % len(self.poster_roster)
         except ZeroDivisionError:
             self.__current_index = 0
-        self.header.update(self.__current_index)
+        self._pending_index = self.__current_index
+        self._header_update_timer.start()
         poster = self.poster_roster[self.__current_index]
         self.poster_label.setPixmap(poster.poster_pixmap)
         self.fading_effect.fade_in()
@@ -692,8 +995,9 @@ class SlideShow(DisplaWindowBase):
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Overloaded method to handle key events.
         """
-        # Disengage the keyboard if there is less than two posters.
-        if len(self.poster_roster) <= 1:
+        # Disengage the keyboard if there is less than two posters, or if the
+        # roster is being loaded.
+        if self._roster_loader is not None or len(self.poster_roster) <= 1:
             return
         # pylint: disable=invalid-name
         key = event.text()
@@ -727,9 +1031,154 @@ class BrowserKeyMap(IntEnum):
 
 
 
-class ProgramTreeWidget(QTreeWidget):
+class _SessionNode:
+
+    """Small container for a top-level (i.e., session) row of a ProgramTreeModel.
+
+    Arguments
+    ---------
+    row : int
+        The row of the session in the model.
+
+    title : str
+        The session title.
+
+    posters : list of program.Poster objects
+        The posters to be displayed as children of the session.
+    """
+
+    def __init__(self, row: int, title: str, posters: list) -> None:
+        """Constructor.
+        """
+        self.row = row
+        self.title = title
+        self.posters = posters
+        # Map the friendly id of the posters to the corresponding row.
+        self.poster_rows = {poster.friendly_id: _row for _row, poster in enumerate(posters)}
+
+
+
+class ProgramTreeModel(QAbstractItemModel):
+
+    """Two-level item model exposing a poster program to a ProgramTreeWidget.
+
+    The top-level rows are the sessions, and their children are the posters.
+    No item object is created---all the cell contents are generated on the
+    fly, in the data() method, from the underlying Poster objects. The
+    internal pointer of the poster indices is the _SessionNode of the parent
+    session, while the session indices carry no pointer.
 
-    """Light wrapper over the QTreeWidget class.
+    Arguments
+    ---------
+    header_labels : list of str
+        The labels for the header of the columns.
+    """
+
+    def __init__(self, header_labels: list) -> None:
+        """Constructor.
+        """
+        super().__init__()
+        self._header_labels = header_labels
+        self._nodes = []
+
+    def set_program(self, sessions):
+        """Set the content of the model.
+
+        Arguments
+        ---------
+        sessions : iterable of (str, list of program.Poster objects) tuples
+            The session titles and the corresponding posters to be displayed.
+        """
+        self.beginResetModel()
+        self._nodes = [_SessionNode(row, title, posters) for row, (title, posters) \
+            in enumerate(sessions)]
+        self.endResetModel()
+
+    def index(self, row, column, parent=QModelIndex()):
+        """Overloaded method.
+        """
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self._nodes[parent.row()])
+
+    def parent(self, index):
+        """Overloaded method.
+        """
+        # pylint: disable=arguments-differ
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        """Overloaded method.
+        """
+        # pylint: disable=invalid-name
+        if not parent.isValid():
+            return len(self._nodes)
+        if parent.internalPointer() is None and parent.column() == 0:
+            return len(self._nodes[parent.row()].posters)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        """Overloaded method.
+        """
+        # pylint: disable=invalid-name, unused-argument
+        return len(self._header_labels)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Overloaded method.
+        """
+        # pylint: disable=invalid-name
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._header_labels[section]
+        return None
+
+    def poster(self, index):
+        """Return the poster corresponding to a given index (or None if the index
+        does not point to a poster).
+        """
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if node is None:
+            return None
+        return node.posters[index.row()]
+
+    def poster_index(self, poster, session_row: int):
+        """Return the index of a given poster within a given session (or an
+        invalid index if the poster is not found).
+        """
+        node = self._nodes[session_row]
+        row = node.poster_rows.get(poster.friendly_id)
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, node)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Overloaded method.
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        column = index.column()
+        poster = self.poster(index)
+        if poster is None:
+            return self._nodes[index.row()].title if column == 0 else None
+        if column == 0:
+            return f'[{poster.friendly_id}] {poster.title}'
+        if column == 1:
+            return poster.presenter.full_name()
+        return f'{poster.screen_id}'
+
+
+
+class ProgramTreeWidget(QTreeView):
+
+    """Light wrapper over the QTreeView class, displaying a ProgramTreeModel.
     """
 
     # Signal emitted when any active key has been pressed.
@@ -747,18 +1196,59 @@ class ProgramTreeWidget(QTreeWidget):
         super().__init__()
         self.__screen_id = screen_id
         if self.__screen_id:
-            self.setColumnCount(3)
-            self.setHeaderLabels(['Session/Poster', 'Presenter', 'Screen'])
+            self._model = ProgramTreeModel(['Session/Poster', 'Presenter', 'Screen'])
+            self.setModel(self._model)
             self.setColumnWidth(0, int(0.75 * width))
             self.setColumnWidth(1, int(0.20 * width))
             self.header().setStretchLastSection(True)
         else:
-            self.setColumnCount(2)
-            self.setHeaderLabels(['Session/Poster', 'Presenter'])
+            self._model = ProgramTreeModel(['Session/Poster', 'Presenter'])
+            self.setModel(self._model)
             self.setColumnWidth(0, int(0.75 * width))
             self.setColumnWidth(1, int(0.25 * width))
         self.__key_press_events_enabled = True
 
+    def set_program(self, sessions):
+        """Set the program to be displayed.
+
+        Arguments
+        ---------
+        sessions : iterable of (str, list of program.Poster objects) tuples
+            The session titles and the corresponding posters to be displayed.
+        """
+        self._model.set_program(sessions)
+
+    def clear(self):
+        """Clear the tree.
+        """
+        self._model.set_program([])
+
+    def session_count(self) -> int:
+        """Return the number of sessions (i.e., top-level rows) in the tree.
+        """
+        return self._model.rowCount()
+
+    def set_session_expanded(self, row: int, expanded: bool):
+        """Expand or collapse a given session.
+        """
+        self.setExpanded(self._model.index(row, 0), expanded)
+
+    def current_poster(self):
+        """Return the poster corresponding to the current index (or None if the
+        current index does not point to a poster).
+        """
+        return self._model.poster(self.currentIndex())
+
+    def set_current_poster(self, poster):
+        """Set the current index to a given poster, within the current session.
+        """
+        parent = self.currentIndex().parent()
+        if not parent.isValid():
+            return
+        index = self._model.poster_index(poster, parent.row())
+        if index.isValid():
+            self.setCurrentIndex(index)
+
     def enable_key_press_events(self):
         """Enable key-press events.
         """
@@ -769,17 +1259,17 @@ class ProgramTreeWidget(QTreeWidget):
         """
         self.__key_press_events_enabled = False
 
-    def collapse_unused(self, current_item):
-        """Small hook to collapse all the expanded items that are different from
-        the current item.
+    def collapse_unused(self, current_index):
+        """Small hook to collapse all the expanded sessions that are different
+        from the current one.
 
         This effectively prevents the user from being able to expand more than
         one top-level item at a time.
         """
-        for index in range(self.topLevelItemCount()):
-            item = self.topLevelItem(index)
-            if item != current_item and item.isExpanded():
-                item.setExpanded(False)
+        for row in range(self._model.rowCount()):
+            index = self._model.index(row, 0)
+            if index != current_index and self.isExpanded(index):
+                self.collapse(index)
 
     def keyPressEvent(self, event):
         """Overloaded method.
@@ -794,7 +1284,7 @@ class ProgramTreeWidget(QTreeWidget):
             self.key_pressed.emit()
         # If we click the EXPAND button and the node is a leaf, then we do
         # want to display the current poster, and we emit the corresponding signal.
-        if event.key() == BrowserKeyMap.EXPAND and self.currentItem().parent() is not None:
+        if event.key() == BrowserKeyMap.EXPAND and self.currentIndex().parent().isValid():
             self.poster_selected.emit()
         # If key-press events are enabled, we just forward the thing to the base class
         # and then return.
@@ -807,6 +1297,137 @@ class ProgramTreeWidget(QTreeWidget):
 
 
 
+class PosterImageLoaderSignals(QObject):
+
+    """Signals for the PosterImageLoader class.
+    """
+
+    # Signal emitted, with the poster and the (sources, images) tuple returned by
+    # Poster.load_images(), when the loading is done.
+    finished = pyqtSignal(object, object)
+
+
+
+class PosterImageLoader(QRunnable):
+
+    """Runnable to decode the images for a given poster off the GUI thread.
+
+    Arguments
+    ---------
+    program : PosterProgram
+        The program the poster belongs to.
+
+    poster : Poster
+        The poster whose images should be loaded.
+
+    poster_width : int
+        The width of the poster pixmap.
+
+    portrait_height : int
+        The height of the presenter and QR code pixmaps.
+    """
+
+    def __init__(self, program, poster, poster_width: int, portrait_height: int) -> None:
+        """Constructor.
+        """
+        super().__init__()
+        self.signals = PosterImageLoaderSignals()
+        self._program = program
+        self._poster = poster
+        self._dimensions = (poster_width, portrait_height)
+
+    def run(self):
+        """Overloaded method.
+
+        Note the poster object is not modified here---all the bookkeeping happens
+        in the GUI thread, when the signal is delivered.
+        """
+        result = self._program.load_poster_images(self._poster, *self._dimensions)
+        self.signals.finished.emit(self._poster, result)
+
+
+
+class PixmapPrefetcher(QObject):
+
+    """Small utility class to load the pixmaps for the posters that we expect to
+    display next in a background thread pool, and keep a bounded cache of the
+    posters that are ready to be displayed.
+
+    The images are decoded in worker threads, and the conversion to pixmaps
+    happens in the GUI thread, when the corresponding signal is delivered.
+    When the cache is full, the least recently used poster is evicted, and
+    its pixmaps unloaded.
+
+    Arguments
+    ---------
+    program : PosterProgram
+        The underlying poster program.
+
+    poster_width : int
+        The width of the poster pixmaps.
+
+    portrait_height : int
+        The height of the presenter and QR code pixmaps.
+
+    max_size : int
+        The maximum number of posters in the cache.
+    """
+
+    def __init__(self, program, poster_width: int, portrait_height: int,
+        max_size: int = 12) -> None:
+        """Constructor.
+        """
+        super().__init__()
+        self._program = program
+        self._dimensions = (poster_width, portrait_height)
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._pending = {}
+
+    def prefetch(self, poster, priority: int = 0):
+        """Schedule the loading of the pixmaps for a given poster, unless these
+        are already loaded or being loaded.
+        """
+        key = poster.program_index
+        if key in self._cache or key in self._pending:
+            return
+        loader = PosterImageLoader(self._program, poster, *self._dimensions)
+        loader.signals.finished.connect(self._on_loaded)
+        # Keep a reference to the loader, so that the signals are not garbage
+        # collected before they are delivered.
+        self._pending[key] = loader
+        QThreadPool.globalInstance().start(loader, priority)
+
+    def _on_loaded(self, poster, result):
+        """Slot called when the images for a poster have been decoded.
+        """
+        key = poster.program_index
+        self._pending.pop(key, None)
+        poster.set_pixmaps(*result)
+        self._cache[key] = poster
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            _, evicted = self._cache.popitem(last=False)
+            evicted.unload_pixmaps()
+
+    def pending(self, poster) -> bool:
+        """Return True if the pixmaps for a given poster are being loaded.
+        """
+        return poster.program_index in self._pending
+
+    def ready(self, poster) -> bool:
+        """Return True if the pixmaps for a given poster are loaded and cached.
+
+        Note this counts as an access for the purpose of the LRU eviction.
+        """
+        key = poster.program_index
+        if key not in self._cache:
+            return False
+        self._cache.move_to_end(key)
+        return True
+
+
+
 class BrowserStatus(Enum):
 
     """Status of the browser finite-state machine.
@@ -823,7 +1444,7 @@ class ProgramBrowser(DisplaWindowBase):
     """Poster browser.
     """
 
-    VALID_KEYS = [key.value for key in BrowserKeyMap]
+    VALID_KEYS = frozenset(key.value for key in BrowserKeyMap)
     DISPLAY_TYPE = 'Program browser'
 
     def __init__(self, **kwargs):
@@ -834,7 +1455,7 @@ class ProgramBrowser(DisplaWindowBase):
         self.header.set_subtitle(self.DISPLAY_TYPE)
         self.poster_label.hide()
         self.tree_widget = ProgramTreeWidget(self.poster_width, screen_id=False)
-        self.tree_widget.itemExpanded.connect(self.tree_widget.collapse_unused)
+        self.tree_widget.expanded.connect(self.tree_widget.collapse_unused)
         self.layout().addWidget(self.tree_widget, 1, 0, 1, 3)
         self.__status = BrowserStatus.TREE_VIEW
         # We need a reference to the current poster so that we can free up the
@@ -843,12 +1464,17 @@ class ProgramBrowser(DisplaWindowBase):
         # Load the program.
         self.program = PosterProgram(kwargs.get('cfgfile'))
         self._load_program()
+        # Setup the prefetcher, and pick the first random poster for the carousel
+        # in advance, so that its pixmaps can be loaded in the background.
+        self.prefetcher = PixmapPrefetcher(self.program, self.poster_width, self.portrait_height)
+        self.__next_random_poster = None
+        self._pick_next_random_poster()
         # Setup the timers. We have two of them---one for the carousel progression
         # and another one for toggling between the different views.
-        self.carousel_timer = QTimer()
+        self.carousel_timer = CountdownTimer()
         self.carousel_timer.setInterval(self.sec_to_msec(kwargs['advance_interval']))
         self.carousel_timer.timeout.connect(self.display_random_poster)
-        self.toggle_timer = QTimer()
+        self.toggle_timer = CountdownTimer()
         self.toggle_timer.setInterval(self.sec_to_msec(kwargs['pause_interval']))
         # Setup the necessary connections.
         self.toggle_timer.timeout.connect(self.toggle_view)
@@ -857,31 +1483,30 @@ class ProgramBrowser(DisplaWindowBase):
         self.tree_widget.key_pressed.connect(self.toggle_timer.start)
         # By default we start the carousel.
         self.start_carousel()
+        self._reload_checks_enabled = True
         # Show the window.
         self._show()
 
+    def _check_reload(self):
+        """Overloaded method.
+
+        When the magic file is found, the listings of the image folders are
+        refreshed, so that the images added since the startup are picked up.
+        """
+        if read_magic_file():
+            logger.info('Refreshing the image folder listings...')
+            self.program.clear_folder_contents()
+            self._load_program()
+
     def _load_program(self):
         """Load the program into the tree viewer.
         """
-        items = []
+        sessions = []
         for session, posters in self.program.items():
-            item = QTreeWidgetItem([session.title])
-            for poster in posters:
-                if self.program.missing_poster_image(poster.friendly_id):
-                    continue
-                presenter = poster.presenter
-                affiliation = presenter.affiliation
-                if pd.isna(affiliation):
-                    affiliation = 'N/A'
-                label = f'[{poster.friendly_id}] {poster.title}'
-                #if self.program.missing_poster_image(poster.friendly_id):
-                #    label = f'{label} (?)'
-                values = [label, presenter.full_name()]
-                child = QTreeWidgetItem(values)
-                child.poster = poster
-                item.addChild(child)
-            items.append(item)
-        self.tree_widget.insertTopLevelItems(0, items)
+            posters = [poster for poster in posters if \
+                poster.friendly_id in self.program.present_ids]
+            sessions.append((session.title, posters))
+        self.tree_widget.set_program(sessions)
 
     def status_message(self):
         """Overloaded method.
@@ -902,21 +1527,44 @@ class ProgramBrowser(DisplaWindowBase):
 
     def unload_current_pixmaps(self):
         """Unload all the pixmaps for the current poster.
+
+        Note that the pixmaps held (or being loaded) by the prefetcher are left
+        alone, as they will be unloaded by the prefetcher itself, when evicted.
         """
-        if self.__current_poster is not None:
-            self.__current_poster.unload_pixmaps()
+        poster = self.__current_poster
+        if poster is not None:
+            if not self.prefetcher.pending(poster) and not self.prefetcher.ready(poster):
+                poster.unload_pixmaps()
             self.__current_poster = None
 
+    def _pick_next_random_poster(self):
+        """Pick the next random poster for the carousel, and prefetch its pixmaps.
+        """
+        self.__next_random_poster = self.program.random_poster()
+        self.prefetcher.prefetch(self.__next_random_poster)
+
+    def _prefetch_neighbors(self, poster):
+        """Prefetch the pixmaps for the posters next to a given one in its session.
+        """
+        for offset in (1, -1):
+            neighbor = self.program.select_by_session_index(poster.session,
+                poster.session_index + offset)
+            self.prefetcher.prefetch(neighbor, QThread.HighPriority)
+
     def _display_poster(self, poster):
         """Base function to display a poster.
         """
-        # Hide the cutsom tree widget and disable the key-press events.
-        self.tree_widget.hide()
-        self.tree_widget.disable_key_press_events()
+        # Hide the cutsom tree widget and disable the key-press events (this is
+        # only needed when coming from the tree view).
+        if self.tree_widget.isVisible():
+            self.tree_widget.hide()
+            self.tree_widget.disable_key_press_events()
         # Unload the pixmaps.
         self.unload_current_pixmaps()
-        # Load the necessary pixmaps for the poster.
-        self.program.load_poster_pixmaps(poster, self.poster_width, self.portrait_height)
+        # Load the necessary pixmaps for the poster, unless they have been
+        # prefetched already.
+        if not self.prefetcher.ready(poster):
+            self.program.load_poster_pixmaps(poster, self.poster_width, self.portrait_height)
         # Update the widgets and show the poster label.
         self.header.set_poster(poster)
         if self.__status == BrowserStatus.CAROUSEL:
@@ -928,38 +1576,52 @@ class ProgramBrowser(DisplaWindowBase):
         self.header.show()
         # Final bookkeeping.
         self.__current_poster = poster
-        self.header_timer.start()
-        self.toggle_timer.start()
+        self._header_updates_enabled = True
+        # Note the toggle timer has no effect in carousel mode, so there is no
+        # point in restarting it at each step of the carousel.
+        if self.__status != BrowserStatus.CAROUSEL:
+            self.toggle_timer.start()
         #self.update_debug_label()
         # And mind we need to get the focus on the main window, otherwise we might
         # be messing around with the underlying tree widget and, even more
         # important, we will not be accepting keyPressEvents.
-        self.setFocus()
+        if not self.hasFocus():
+            self.setFocus()
 
     def display_current_poster(self):
         """Display the poster corresponding to the current item.
         """
         self.__status = BrowserStatus.POSTER_VIEW
-        self._display_poster(self.tree_widget.currentItem().poster)
+        poster = self.tree_widget.current_poster()
+        self._display_poster(poster)
+        self._prefetch_neighbors(poster)
 
     def display_random_poster(self):
         """Display a randomly chosen poster.
+
+        Note the poster has been picked in advance, and we pick the next one
+        right away, so that its pixmaps can be loaded in the background.
         """
-        self._display_poster(self.program.random_poster())
+        self._display_poster(self.__next_random_poster)
+        self._pick_next_random_poster()
 
     def display_next_poster(self):
         """Display the next poster in the program.
         """
         session = self.__current_poster.session
         index = self.__current_poster.session_index
-        self._display_poster(self.program.select_by_session_index(session, index + 1))
+        poster = self.program.select_by_session_index(session, index + 1)
+        self._display_poster(poster)
+        self._prefetch_neighbors(poster)
 
     def display_previous_poster(self):
         """Display the previous poster in the program.
         """
         session = self.__current_poster.session
         index = self.__current_poster.session_index
-        self._display_poster(self.program.select_by_session_index(session, index - 1))
+        poster = self.program.select_by_session_index(session, index - 1)
+        self._display_poster(poster)
+        self._prefetch_neighbors(poster)
 
     def toggle_view(self):
         """Toggle between the different views.
@@ -988,17 +1650,11 @@ class ProgramBrowser(DisplaWindowBase):
         # When we enter the tree view from the poster view, we want to make sure
         # that the selected entry in the corresponding widget is corresponding
         # to the last poster that we have seen.
-        try:
-            selected_poster = self.tree_widget.currentItem().poster
-        except AttributeError:
+        selected_poster = self.tree_widget.current_poster()
+        if selected_poster is None:
             return
         if self.__current_poster is not None and selected_poster != self.__current_poster:
-            parent = self.tree_widget.currentItem().parent()
-            for i in range(parent.childCount()):
-                item = parent.child(i)
-                if item.poster == self.__current_poster:
-                    self.tree_widget.setCurrentItem(item)
-                    break
+            self.tree_widget.set_current_poster(self.__current_poster)
 
     def start_carousel(self):
         """Start the carousel.
@@ -1059,14 +1715,13 @@ class SessionDirectory(DisplaWindowBase):
         self.tree_widget = ProgramTreeWidget(self.poster_width, screen_id=True)
         self.layout().addWidget(self.tree_widget, 1, 0, 1, 3)
         # Setup the timers.
-        self.toggle_timer = QTimer()
+        self.toggle_timer = CountdownTimer()
         self.toggle_timer.setInterval(self.advance_interval)
         self.toggle_timer.timeout.connect(self.toggle_session)
-        self.header_timer.start()
-        self.reload_timer = QTimer()
-        self.reload_timer.setInterval(10000)
-        self.reload_timer.timeout.connect(self._check_reload)
         self._reload_due = None
+        # Tuple of the sessions currently displayed, so that we do not rebuild
+        # the tree when nothing has changed.
+        self._displayed_sessions = None
         # Load the program
         self.program = PosterProgram(kwargs.get('cfgfile'))
         self.__num_sessions = self._load_program()
@@ -1075,11 +1730,10 @@ class SessionDirectory(DisplaWindowBase):
         #if self.__num_sessions > 1:
         #    self.toggle_timer.start()
         #else:
-        #    self.header_timer.stop()
+        #    self._header_updates_enabled = False
         #self.toggle_session()
 
-        self.header_timer.stop()
-        self.reload_timer.start()
+        self._reload_checks_enabled = True
         self.expand_all()
         self._show()
 
@@ -1088,52 +1742,57 @@ class SessionDirectory(DisplaWindowBase):
         """
         logger.debug('Checking if directory needs to be reloaded.')
         if read_magic_file() or (self._reload_due is not None and datetime.datetime.now() > self._reload_due):
+            self.program.clear_folder_contents()
             self.__num_sessions = self._load_program()
             self.__current_index = -1
             self.expand_all()
 
     def _load_program(self):
         """Load the program.
+
+        Note the tree is only rebuilt if the set of ongoing sessions has changed
+        since the last call.
         """
         self._reload_due = None
-        self.tree_widget.clear()
-        items = []
+        sessions = []
         for session, posters in self.program.items():
             if not session.ongoing(self.display_datetime):
                 continue
             end = session.end
             if self._reload_due is None or end < self._reload_due:
                 self._reload_due = end
-            item = QTreeWidgetItem([session.title])
-            for poster in posters:
-                presenter = poster.presenter
-                affiliation = presenter.affiliation
-                if pd.isna(affiliation):
-                    affiliation = 'N/A'
-                values = [f'[{poster.friendly_id}] {poster.title}', presenter.full_name(),
-                    f'{poster.screen_id}']
-                child = QTreeWidgetItem(values)
-                child.poster = poster
-                item.addChild(child)
-            items.append(item)
-        self.tree_widget.insertTopLevelItems(0, items)
-        logger.info(f'Reload due on {self._reload_due}')
-        return len(items)
+            sessions.append((session, posters))
+        displayed_sessions = tuple(session for session, _ in sessions)
+        if displayed_sessions != self._displayed_sessions:
+            self._displayed_sessions = displayed_sessions
+            self.tree_widget.set_program([(session.title, posters) for session, posters in sessions])
+        else:
+            logger.info('Ongoing sessions unchanged, skipping the tree rebuild...')
+        logger.info('Reload due on %s', self._reload_due)
+        return len(sessions)
 
     def expand_all(self):
         """Expand all the items in the program tree.
         """
-        for i in range(self.__num_sessions):
-            item = self.tree_widget.topLevelItem(i)
-            item.setExpanded(True)
+        self.tree_widget.expandAll()
 
     def toggle_session(self):
         """Toggle the section being displayed.
+
+        Note that, once the first session has been toggled, only the previous and
+        the next sessions are changing state, and there is no need to touch the
+        others.
         """
+        previous_index = self.__current_index
         self.__current_index = (self.__current_index + 1) % self.__num_sessions
-        for index in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(index)
-            item.setExpanded(index == self.__current_index)
+        self.tree_widget.setUpdatesEnabled(False)
+        if previous_index < 0:
+            for index in range(self.tree_widget.session_count()):
+                self.tree_widget.set_session_expanded(index, index == self.__current_index)
+        else:
+            self.tree_widget.set_session_expanded(previous_index, False)
+            self.tree_widget.set_session_expanded(self.__current_index, True)
+        self.tree_widget.setUpdatesEnabled(True)
 
     def status_message(self):
         """Do nothing overloaded method.
@@ -20,6 +20,7 @@ This is using the INDICO API to help accessing the conference content, see
 https://docs.getindico.io/en/stable/
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import datetime
 import json
 import os
@@ -27,9 +28,14 @@ import os
 import pandas as pd
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from pisameet import logger
 from pisameet.program import PosterCollectionBase, DATETIME_FORMAT
-from pisameet.qrcode_ import generate_qrcode
+from pisameet.qrcode_ import generate_qrcodes
 
 
 # pylint: disable=invalid-name
@@ -68,15 +74,58 @@ def retrieve_info(url: str, file_path: str , detail: str = 'sessions', overwrite
         return
     logger.info('Retrieving program from %s...', url)
     resp = requests.get(f'{url}?detail={detail}&pretty=yes')
-    data = resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
     logger.info('Saving data to %s...', file_path)
-    with open(file_path, 'w') as f:
-        json.dump(data, f)
+    dump_json(data, file_path)
     logger.info('Done.')
 
 
 
 
+def load_json(file_path: str):
+    """Load a .json file.
+
+    This is using the orjson parser, which is considerably faster than the
+    json module in the standard library and allocates less transient memory,
+    when available, and falls back to the latter otherwise.
+
+    Arguments
+    ---------
+    file_path : str
+        The path to the input .json file.
+    """
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+
+def dump_json(data, file_path: str):
+    """Dump some data to a .json file.
+
+    This is the counterpart of load_json(), and equally uses the orjson
+    serializer, when available. Note that orjson returns bytes, which are written
+    to the output file in binary mode, with no intermediate string.
+
+    Arguments
+    ---------
+    data : dict
+        The data to be written.
+
+    file_path : str
+        The path to the output .json file.
+    """
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+        return
+    with open(file_path, 'w') as f:
+        json.dump(data, f)
+
+
+
 class ConferenceInfo(dict):
 
     """Small convenience class describing the full list of contributions for a
@@ -129,8 +178,7 @@ class ConferenceInfo(dict):
         """
         super().__init__()
         logger.info('Loading conference contributions from %s...', file_path)
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = load_json(file_path)
         # Parse the json hierarchy.
         results = data['results'][0]
         sessions = results['sessions']
@@ -144,11 +192,12 @@ class ConferenceInfo(dict):
         # * tweak the session title is necessary.
         if session_dict is not None:
             logger.info('Filtering sessions...')
+            sessions_by_id = {session['id']: session for session in sessions}
             for _id, _title in session_dict.items():
-                for session in sessions:
-                    if session['id'] == _id:
-                        session['title'] = _title
-                        self[_title] = session
+                session = sessions_by_id.get(_id)
+                if session is not None:
+                    session['title'] = _title
+                    self[_title] = session
         contributions = results['contributions']
         if len(contributions):
             logger.warning('%d orphan contribution(s) found...', len(contributions))
@@ -160,12 +209,9 @@ class ConferenceInfo(dict):
         """Return all the contribution ids.
         """
         logger.info('Retrieving all the contribution identifiers...')
-        ids = []
-        for session in self.values():
-            for contribution in session['contributions']:
-                ids.append(int(contribution['id']))
+        ids = sorted(int(contribution['id']) for session in self.values() \
+            for contribution in session['contributions'])
         logger.info('Done, %d contribution(s) found.', len(ids))
-        ids.sort()
         return ids
 
     @staticmethod
@@ -189,7 +235,14 @@ class ConferenceInfo(dict):
 
         This means turning {'date': '2015-05-28', 'time': '15:45:00', 'tz': 'Europe/Rome'}
         into 28/05/2015 15:45.
+
+        Since the layout of the input is fixed, for the default output format we
+        simply splice the strings, and avoid the parsing/formatting altogether.
         """
+        if fmt == DATETIME_FORMAT:
+            year, month, day = date_dict['date'].split('-')
+            hours, minutes, _ = date_dict['time'].split(':')
+            return f'{day}/{month}/{year} {hours}:{minutes}'
         text = f'{date_dict["date"]} {date_dict["time"]}'
         d = datetime.datetime.strptime(text, '%Y-%m-%d %H:%M:%S')
         return d.strftime(fmt)
@@ -239,40 +292,25 @@ class ConferenceInfo(dict):
             logger.warning('%s for contribution %s (%s...)', msg, contribution['id'],
                 contribution['title'][:max_title_length])
 
-        # Loop over all the contributions in the session and retrieve the data.
-        # Note that, rather than doing this by column, we do it by row (i.e., by
-        # contribution), the basic idea being that we can provide more granular
-        # diagnostics if data are missing, at the expense of code beauty.
+        # Assemble the data for all the contributions in the session at once,
+        # and use boolean masks to provide granular diagnostics on the
+        # contributions with missing data.
+        speaker_cols = ('first_name', 'last_name', 'affiliation')
         for session in self.values():
-            data = [[], [], [], [], [], []]
-            for contrib in session['contributions']:
-                _id = contrib['id']
-                _title = contrib['title']
-                _url = contrib['url']
-                _db_id = contrib['db_id']
-                try:
-                    first_speaker = contrib['speakers'][0]
-                except IndexError as e:
-                    _warning_message('No speaker(s)', contrib)
-                    first_speaker = None
-                if first_speaker is not None:
-                    _first_name = first_speaker['first_name']
-                    _last_name = first_speaker['last_name']
-                    _affiliation = first_speaker['affiliation']
-                    if _first_name == '':
-                        _warning_message('No first name', contrib)
-                    if _last_name == '':
-                        _warning_message('No last name', contrib)
-                    if _affiliation == '':
-                        _warning_message('No affiliation', contrib)
-                else:
-                    _first_name, _last_name, _affiliation = 'N/A', 'N/A', 'N/A'
-                for col, val in zip(data, (_id, _db_id, _title, _first_name, _last_name, _affiliation)):
-                    col.append(val)
-
+            df = pd.DataFrame(session['contributions'], columns=('id', 'db_id', 'title', 'speakers'))
+            first_speaker = df['speakers'].str[0]
+            mask = first_speaker.notna()
+            speakers = pd.DataFrame(first_speaker[mask].tolist(), index=df.index[mask],
+                columns=speaker_cols).reindex(df.index)
+            for _, contrib in df[~mask].iterrows():
+                _warning_message('No speaker(s)', contrib)
+            for col, label in zip(speaker_cols, ('first name', 'last name', 'affiliation')):
+                for _, contrib in df[speakers[col] == ''].iterrows():
+                    _warning_message(f'No {label}', contrib)
+            speakers = speakers.fillna('N/A')
             # Placeholder for the screen id.
-            screen_id = [i % 20 + 1 for i in range(len(session['contributions']))]
-            data.insert(2, screen_id)
+            screen_id = df.index % 20 + 1
+            data = (df['id'], df['db_id'], screen_id, df['title'], *(speakers[col] for col in speaker_cols))
             df = pd.DataFrame({key: val for key, val in zip(PosterCollectionBase.SESSION_COL_NAMES, data)})
             sheet_name = str(session['id'])
             df.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -312,12 +350,79 @@ class ConferenceInfo(dict):
             logger.warning('No attachment for "%s"', contribution["title"])
         return urls
 
+    @staticmethod
+    def _download_file(http_session, url: str, file_path: str, tstamp_file_path: str,
+        timestamp: str, etag: str = None, chunk_size: int = 1 << 16) -> bool:
+        """Download a single file, and write the corresponding timestamp (and
+        ETag, if provided by the server).
+
+        If the ETag of a previous download is passed, this is sent to the server
+        in a conditional request, and the body of the response is not transferred
+        at all if the file has not changed.
+
+        Arguments
+        ---------
+        http_session : requests.Session
+            The HTTP session to be used for the download.
+
+        url : str
+            The download url.
+
+        file_path : str
+            The path to the output file.
+
+        tstamp_file_path : str
+            The path to the output file holding the timestamp.
+
+        timestamp : str
+            The timestamp of the file in the conference info.
+
+        etag : str
+            The ETag of the local copy of the file (if any).
+
+        Return
+        ------
+            True if the file was actually downloaded, False if the local copy
+            was up to date.
+        """
+        # pylint: disable=too-many-arguments
+        headers = {'If-None-Match': etag} if etag is not None else None
+        with http_session.get(url, headers=headers, stream=True) as response:
+            if response.status_code == 304:
+                logger.info('%s not modified on the server, skipping...', file_path)
+                downloaded = False
+            else:
+                logger.info('Downloading %s -> %s...', url, file_path)
+                with open(file_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size):
+                        f.write(chunk)
+                etag = response.headers.get('ETag')
+                if etag is not None:
+                    with open(f'{file_path}.etag', 'w') as f:
+                        f.write(etag)
+                downloaded = True
+        # And, of course, we need to write the timestamp, as well.
+        logger.info('Writing file timestamp to %s...', tstamp_file_path)
+        with open(tstamp_file_path, 'w') as f:
+            f.write(timestamp)
+        return downloaded
+
     def download_attachments(self, folder_path: str, separator: str = '-',
-        filters=('pdf', 'ppt', 'pptx', 'png', 'jpg', 'jpeg'), dry_run: bool = False):
+        filters=('pdf', 'ppt', 'pptx', 'png', 'jpg', 'jpeg'), dry_run: bool = False,
+        max_workers: int = 16):
         """Download all the files attached to the given conference program.
+
+        The list of the files to be downloaded is assembled first, and the actual
+        downloads are then carried out concurrently in a pool of worker threads,
+        all sharing the same HTTP session (and hence the underlying connections).
+
+        Note the content of the target folder is listed once, rather than checking
+        for the existence of each file separately.
         """
+        # pylint: disable=too-many-arguments, too-many-locals
         logger.info('Downloading files...')
-        num_downloads = 0
+        present = set(os.listdir(folder_path))
+        download_list = []
         for session in self.values():
             logger.info('Processing session "%s"', session["title"])
             for contribution in session['contributions']:
@@ -325,36 +430,60 @@ class ConferenceInfo(dict):
                     file_name = f'{int(contribution["id"]):03d}{separator}{os.path.basename(url)}'
                     file_path = os.path.join(folder_path, file_name)
                     tstamp_file_path = f'{file_path}.tstamp'
-                    # If we have the file locally, and we have track of the
-                    # timestamp, and that matches the one in the .json file,
-                    # thers is no point in downloading another identical copy.
-                    if os.path.exists(file_path) and os.path.exists(tstamp_file_path) \
-                        and open(tstamp_file_path).read() == timestamp:
-                        logger.debug('%s up to date, skipping...', file_path)
-                        continue
+                    etag = None
+                    if file_name in present:
+                        # If we have the file locally, and we have track of the
+                        # timestamp, and that matches the one in the .json file,
+                        # thers is no point in downloading another identical copy.
+                        if f'{file_name}.tstamp' in present:
+                            with open(tstamp_file_path) as f:
+                                if f.read() == timestamp:
+                                    logger.debug('%s up to date, skipping...', file_path)
+                                    continue
+                        # Otherwise, if we have the ETag of the local copy, we
+                        # can still let the server tell us if it is up to date.
+                        if f'{file_name}.etag' in present:
+                            with open(f'{file_path}.etag') as f:
+                                etag = f.read()
                     # Otherwise we're good to go.
-                    logger.info('Downloading %s -> %s...', url, file_path)
-                    if not dry_run:
-                        response = requests.get(url)
-                        with open(file_path, 'wb') as f:
-                            f.write(response.content)
-                        num_downloads += 1
-                    # And, of course, we need to write the timestamp, as well.
-                    logger.info('Writing file timestamp to %s...', file_path)
-                    if not dry_run:
-                        with open(tstamp_file_path, 'w') as f:
-                            f.write(timestamp)
-        logger.info(f'{num_downloads} additional file(s) downloaded.')
-
-    def generate_qr_codes(self, folder_path):
+                    download_list.append((url, file_path, tstamp_file_path, timestamp, etag))
+        if dry_run:
+            for url, file_path, *_ in download_list:
+                logger.info('Downloading %s -> %s (dry run)...', url, file_path)
+            return
+        num_downloads = 0
+        with requests.Session() as http_session, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Size the connection pool after the number of workers---the default
+            # (10 connections per host) would force some of the threads to open
+            # and discard connections, rather than reusing them.
+            adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers,
+                pool_maxsize=max_workers)
+            http_session.mount('https://', adapter)
+            http_session.mount('http://', adapter)
+            futures = [executor.submit(self._download_file, http_session, *args) \
+                for args in download_list]
+            for future in as_completed(futures):
+                num_downloads += future.result()
+        logger.info('%d additional file(s) downloaded.', num_downloads)
+
+    def generate_qr_codes(self, folder_path, max_workers=None, chunksize=16):
         """Generate all the QR codes for the poster contributions.
+
+        The QR codes that already exist in the target folder are skipped before
+        the work is dispatched, and the remaining ones are generated in a pool
+        of worker processes, since the encoding is CPU-bound.
         """
+        present = set(os.listdir(folder_path))
+        pairs = []
         for session in self.values():
             for contrib in session['contributions']:
-                url = contrib['url']
                 file_name = f'{contrib["friendly_id"]:03}.png'
-                file_path = os.path.join(folder_path, file_name)
-                generate_qrcode(url, file_path)
+                if file_name in present:
+                    logger.debug('QR code %s exists, skipping...', file_name)
+                    continue
+                pairs.append((contrib['url'], os.path.join(folder_path, file_name)))
+        generate_qrcodes(pairs, max_workers, chunksize)
 
     def __str__(self):
         """String formatting.
@@ -36,7 +36,7 @@ class DisplayMode(Enum):
 
 
 
-VALID_DISPLAY_MODES = [mode.value for mode in DisplayMode]
+VALID_DISPLAY_MODES = tuple(mode.value for mode in DisplayMode)
 
 
 
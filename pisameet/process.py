@@ -18,11 +18,73 @@
 """Pre-processing tools.
 """
 
+import fnmatch
 import os
+import re
 
+from pisameet import logger
 
 
-def crawl(folder_path: str, file_type: str = '.pdf', filter_pattern: str = None) -> list:
+def _file_matcher(file_type, filter_pattern: str = None):
+    """Return a function that, given a file name, tells whether the file is of
+    (one of) the given type(s) and matches the given pattern.
+
+    All the preprocessing (i.e., the normalization of the file extension(s) and
+    the compilation of the filter pattern) is done once, here, rather than for
+    each file.
+
+    Arguments
+    ---------
+    file_type : str or tuple of str
+        The file extension(s), including the dot (e.g., '.pdf'). Note the
+        comparison is case-sensitive, as for a plain str.endswith() call.
+
+    filter_pattern : str
+        An optional filtering pattern. If the pattern contains any of the
+        wildcards * and ?, it is interpreted as a glob pattern to be matched
+        against the full file name, otherwise only the files containing the
+        pattern in the name are retained.
+    """
+    if isinstance(file_type, str):
+        file_type = (file_type, )
+    file_types = tuple(file_type)
+    if filter_pattern is None:
+        return lambda name: name.endswith(file_types)
+    if '*' in filter_pattern or '?' in filter_pattern:
+        regex = re.compile(fnmatch.translate(filter_pattern))
+        return lambda name: name.endswith(file_types) and regex.match(name) is not None
+    return lambda name: name.endswith(file_types) and filter_pattern in name
+
+
+def _scan_folder(folder_path: str, match):
+    """Scan a single folder (non recursively) and return the list of the
+    subfolders, along with the list of the files whose name is accepted by a
+    given matching function (see _file_matcher()).
+
+    This is the basic unit of work for crawl(). Note the type of the directory
+    entries is typically cached from the underlying readdir() call, and, as
+    os.walk() does by default, we do not descend into symbolic links to folders.
+
+    Also, as os.walk() does, folders that do not exist or cannot be read are
+    (logged and) skipped, rather than raising an exception.
+    """
+    folders = []
+    files = []
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        folders.append(entry.path)
+                elif match(entry.name):
+                    files.append(entry.path)
+    except OSError as exception:
+        logger.warning('Cannot scan %s: %s', folder_path, exception)
+    return folders, files
+
+
+def crawl(folder_path: str, file_type='.pdf', filter_pattern: str = None,
+    sort: bool = True) -> list:
     """Crawl a given folder recursively and return a list of all the files of
     a given type matching a given pattern.
 
@@ -31,22 +93,30 @@ def crawl(folder_path: str, file_type: str = '.pdf', filter_pattern: str = None)
     folder_path : str
         The path to the root folder to be recursively crawled.
 
-    file_type : str
-        The file extension, including the dot (e.g., '.pdf')
+    file_type : str or tuple of str
+        The file extension(s), including the dot (e.g., '.pdf'), matched in a
+        case-sensitive fashion.
 
     filter_pattern : str
         An optional filtering pattern---if not None, only the files containing
-        the pattern in the name are retained.
+        the pattern in the name (or matching it, for glob patterns with * or ?
+        wildcards) are retained.
+
+    sort : bool
+        If True, the output list is sorted (callers that do not rely on the order
+        can set this to False and save the sorting).
 
     Return
     ------
     A list of absolute file paths.
     """
+    match = _file_matcher(file_type, filter_pattern)
     file_list = []
-    for root, _, files in os.walk(folder_path):
-        file_list += [os.path.join(root, file) for file in files if file.endswith(file_type)]
-    file_list.sort()
-    if filter_pattern is not None:
-        file_list = [file_path for file_path in file_list \
-            if filter_pattern in os.path.basename(file_path)]
+    stack = [folder_path]
+    while stack:
+        folders, files = _scan_folder(stack.pop(), match)
+        stack += folders
+        file_list += files
+    if sort:
+        file_list.sort()
     return file_list
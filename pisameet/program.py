@@ -18,14 +18,27 @@
 """
 
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import datetime
+import functools
+import itertools
 import os
 import random
 
 import pandas as pd
 #pylint: disable=no-name-in-module
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap, QPixmapCache
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+try:
+    import PIL.Image
+except ImportError:
+    PIL = None
 
 from pisameet import logger, MISSING_PICTURE_PATH, MISSING_POSTER_PATH, MISSING_QRCODE_PATH
 
@@ -35,6 +48,13 @@ DATE_FORMAT =  '%d/%m/%Y'
 DATE_PRETTY_FORMAT = '%A, %B %d, %Y'
 DATETIME_FORMAT =  f'{DATE_FORMAT} %H:%M'
 
+# Maximum number of worker threads for decoding the images.
+_MAX_WORKERS = os.cpu_count() or 1
+
+# Engine for parsing the excel configuration file---we use the (much faster)
+# calamine engine if available, and leave the choice to pandas otherwise.
+_EXCEL_ENGINE = 'calamine' if python_calamine is not None else None
+
 
 class Presenter:
 
@@ -52,17 +72,24 @@ class Presenter:
         The presenter affiliation.
     """
 
+    __slots__ = ('first_name', 'last_name', 'affiliation', '_full_name')
+
     def __init__(self, first_name: str, last_name: str, affiliation: str) -> None:
         """Constructor
         """
         self.first_name = first_name
         self.last_name = last_name
         self.affiliation = affiliation
+        self._full_name = None
 
     def full_name(self) -> str:
         """Return the presenter full name.
+
+        (The value is cached at the first call.)
         """
-        return f'{self.first_name} {self.last_name}'
+        if self._full_name is None:
+            self._full_name = f'{self.first_name} {self.last_name}'
+        return self._full_name
 
     def __str__(self) -> str:
         """String formatting.
@@ -96,6 +123,12 @@ class Poster:
 
     #pylint: disable=too-many-instance-attributes, too-many-arguments
 
+    # Note the presenter_pixmap and qrcode_pixmap properties are served from
+    # the QPixmapCache and do not need a slot.
+    __slots__ = ('friendly_id', 'db_id', 'screen_id', 'title', 'presenter', 'poster_pixmap',
+        '_presenter_file_path', '_qrcode_file_path', '_portrait_height', '_poster_cache_key',
+        'session', 'session_index', 'program_index', '_short_titles')
+
     def __init__(self, friendly_id: int, db_id: int, screen_id: int,
         title: str, presenter) -> None:
         """Constructor.
@@ -106,46 +139,124 @@ class Poster:
         self.title = title
         self.presenter = presenter
         self.poster_pixmap = None
-        self.presenter_pixmap = None
-        self.qrcode_pixmap = None
+        # Note the presenter and QR code pixmaps are not stored in the object,
+        # but rather served on demand from the QPixmapCache, see the
+        # presenter_pixmap and qrcode_pixmap properties.
+        self._presenter_file_path = None
+        self._qrcode_file_path = None
+        self._portrait_height = None
+        self._poster_cache_key = None
         self.session = None
         self.session_index = None
         self.program_index = None
+        self._short_titles = {}
 
     @classmethod
-    def from_df_row(cls, row):
-        """Create a PosterSession object from a dataframe row.
+    def from_data_frame(cls, data_frame) -> list:
+        """Create a list of Poster objects from a session data frame.
+
+        Note the columns are extracted once and zipped together, which is much
+        faster than iterating over the rows of the data frame.
         """
-        args = [row[col_name] for col_name in PosterRoster.SESSION_COL_NAMES]
-        if not pd.isna(args[2]):
-            args[2] = int(args[2])
-        return cls(*args[:-3], Presenter(*args[-3:]))
+        columns = [data_frame[col_name].tolist() for col_name in PosterRoster.SESSION_COL_NAMES]
+        return [cls(*args[:-3], Presenter(*args[-3:])) for args in zip(*columns)]
 
     def short_title(self, max_chars=40):
         """Return a shortened version of the title, trimmed to a fixed maximum
         number of characters if too long.
+
+        (The values are cached, for each max_chars, at the first call.)
+
+        Note titles shorter than max_chars are returned as they are, with no
+        padding---the width of the columns in the poster browser is fixed anyway,
+        and pretty_print() takes care of the alignment in the text output.
         """
         if len(self.title) <= max_chars:
-            return self.title.ljust(max_chars)
-        return f'{self.title[:max_chars - 3]}...'
+            return self.title
+        try:
+            return self._short_titles[max_chars]
+        except KeyError:
+            pass
+        title = f'{self.title[:max_chars - 3]}...'
+        self._short_titles[max_chars] = title
+        return title
 
     @staticmethod
     def _load_pixmap_w(file_path: str, width: int):
         """Load the underlying pixmap with a fixed width.
         """
-        logger.debug('Loading image data from %s...', file_path)
-        return QPixmap(file_path).scaledToWidth(width, Qt.SmoothTransformation)
+        return QPixmap.fromImage(Poster._load_image_w(file_path, width))
 
     @staticmethod
     def _load_pixmap_h(file_path: str, height: int):
         """Load the underlying pixmap with a fixed height.
         """
-        logger.debug('Loading image data from %s...', file_path)
-        return QPixmap(file_path).scaledToHeight(height, Qt.SmoothTransformation)
+        return QPixmap.fromImage(Poster._load_image_h(file_path, height))
 
     @staticmethod
-    def load_default_pixmaps(poster_width: int, portrait_height: int):
+    def _pixmap_cache_key(file_path: str, height: int) -> str:
+        """Return the QPixmapCache key for a given image scaled to a given height.
         """
+        return f'{file_path}:{height}'
+
+    @staticmethod
+    def _poster_pixmap_cache_key(file_path: str, width: int) -> str:
+        """Return the QPixmapCache key for a given poster image scaled to a given width.
+        """
+        return f'{file_path}:w{width}'
+
+    @staticmethod
+    def _cached_pixmap_w(file_path: str, width: int):
+        """Return the pixmap for a given image, scaled to a given width, from
+        the QPixmapCache, loading it on a cache miss.
+        """
+        key = Poster._poster_pixmap_cache_key(file_path, width)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = Poster._load_pixmap_w(file_path, width)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _cached_pixmap_h(file_path: str, height: int):
+        """Return the pixmap for a given image, scaled to a given height, from
+        the QPixmapCache, loading it on a cache miss.
+        """
+        if file_path is None:
+            return None
+        key = Poster._pixmap_cache_key(file_path, height)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = Poster._load_pixmap_h(file_path, height)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @property
+    def presenter_pixmap(self):
+        """Return the presenter pixmap.
+        """
+        return self._cached_pixmap_h(self._presenter_file_path, self._portrait_height)
+
+    @property
+    def qrcode_pixmap(self):
+        """Return the QR code pixmap.
+        """
+        return self._cached_pixmap_h(self._qrcode_file_path, self._portrait_height)
+
+    def _set_portrait_sources(self, presenter_file_path, qrcode_file_path, portrait_height):
+        """Set the sources for the presenter and QR code pixmaps.
+        """
+        self._presenter_file_path = presenter_file_path
+        self._qrcode_file_path = qrcode_file_path
+        self._portrait_height = portrait_height
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def load_default_pixmaps(poster_width: int, portrait_height: int):
+        """Load the default pixmaps for the poster and the QR code.
+
+        The pixmaps are cached for any given set of dimensions, so that the
+        default images are only decoded and scaled once.
         """
         return Poster._load_pixmap_w(MISSING_POSTER_PATH, poster_width),\
             Poster._load_pixmap_h(MISSING_QRCODE_PATH, portrait_height)
@@ -153,12 +264,122 @@ class Poster:
     def load_pixmaps(self, poster_file_path, presenter_file_path, qrcode_file_path,
         poster_width, portrait_height):
         """Load all the necessary poster data.
+
+        Note the poster pixmap is served from the QPixmapCache, if available, so
+        that revisiting a poster does not require decoding the image again.
         """
         #pylint: disable=too-many-arguments
         logger.info('Loading data for poster %s...', self)
-        self.poster_pixmap = self._load_pixmap_w(poster_file_path, poster_width)
-        self.presenter_pixmap = self._load_pixmap_h(presenter_file_path, portrait_height)
-        self.qrcode_pixmap = self._load_pixmap_h(qrcode_file_path, portrait_height)
+        self.poster_pixmap = self._cached_pixmap_w(poster_file_path, poster_width)
+        self._set_portrait_sources(presenter_file_path, qrcode_file_path, portrait_height)
+
+    @staticmethod
+    def _read_image(file_path: str, width: int = None, height: int = None):
+        """Read an image from file, scaled to a given width or height (with the
+        aspect ratio preserved).
+
+        When the underlying image format supports it (e.g., for jpeg files), the
+        image is decoded directly at the target resolution, rather than decoded
+        at full resolution and scaled afterwards. Otherwise, if PIL is available,
+        we use it for the decoding and the scaling (see _read_image_pil()), and
+        fall back to a smooth scaling of the full-resolution image in Qt if not.
+
+        Note this is safe to be called outside the GUI thread.
+        """
+        logger.debug('Loading image data from %s...', file_path)
+        reader = QImageReader(file_path)
+        size = reader.size()
+        if size.isValid():
+            if width is not None:
+                target = QSize(width, round(size.height() * width / size.width()))
+            else:
+                target = QSize(round(size.width() * height / size.height()), height)
+            # Only downscale during the decoding.
+            if reader.supportsOption(QImageIOHandler.ScaledSize) and \
+                target.width() <= size.width():
+                reader.setScaledSize(target)
+                return reader.read()
+            if PIL is not None:
+                return Poster._read_image_pil(file_path, target)
+        image = reader.read()
+        if width is not None:
+            return image.scaledToWidth(width, Qt.SmoothTransformation)
+        return image.scaledToHeight(height, Qt.SmoothTransformation)
+
+    @staticmethod
+    def _read_image_pil(file_path: str, size):
+        """Read an image from file with PIL, and scale it to a given size.
+
+        This is used for the formats that Qt cannot decode at a reduced size
+        (e.g., png), as the resampling in PIL (with the reducing_gap optimization)
+        is considerably faster than the smooth scaling in Qt.
+
+        Note the QImage returned is a deep copy, and does not reference the
+        memory buffer of the PIL image.
+        """
+        with PIL.Image.open(file_path) as img:
+            img = img.convert('RGBA').resize((size.width(), size.height()),
+                PIL.Image.LANCZOS, reducing_gap=3.)
+        data = img.tobytes()
+        image = QImage(data, img.width, img.height, 4 * img.width, QImage.Format_RGBA8888)
+        return image.copy()
+
+    @staticmethod
+    def _load_image_w(file_path: str, width: int):
+        """Load the underlying image with a fixed width.
+
+        Note that, unlike the _load_pixmap_w() method, this is safe to be called
+        outside the GUI thread.
+        """
+        return Poster._read_image(file_path, width=width)
+
+    @staticmethod
+    def _load_image_h(file_path: str, height: int):
+        """Load the underlying image with a fixed height.
+
+        Note that, unlike the _load_pixmap_h() method, this is safe to be called
+        outside the GUI thread.
+        """
+        return Poster._read_image(file_path, height=height)
+
+    def load_images(self, poster_file_path, presenter_file_path, qrcode_file_path,
+        poster_width, portrait_height):
+        """Load all the necessary poster data as QImage objects.
+
+        This is the thread-safe counterpart of load_pixmaps(), and returns a
+        (sources, images) tuple, where sources collects the input arguments and
+        images the poster, presenter and QR code images. This can be passed
+        to set_pixmaps() in the GUI thread to turn the images into pixmaps.
+
+        Note this does not touch the state of the object, as the latter might be
+        shared with the GUI thread.
+        """
+        #pylint: disable=too-many-arguments
+        logger.info('Loading data for poster %s...', self)
+        sources = (poster_file_path, presenter_file_path, qrcode_file_path,
+            poster_width, portrait_height)
+        images = (self._load_image_w(poster_file_path, poster_width),
+            self._load_image_h(presenter_file_path, portrait_height),
+            self._load_image_h(qrcode_file_path, portrait_height))
+        return sources, images
+
+    def set_pixmaps(self, sources, images):
+        """Set all the poster pixmaps from the output of load_images().
+
+        Note all the pixmaps are inserted in the QPixmapCache, as well. This must
+        be called in the GUI thread.
+        """
+        poster_file_path, presenter_file_path, qrcode_file_path, poster_width,\
+            portrait_height = sources
+        poster_image, presenter_image, qrcode_image = images
+        self._poster_cache_key = self._poster_pixmap_cache_key(poster_file_path, poster_width)
+        self._set_portrait_sources(presenter_file_path, qrcode_file_path, portrait_height)
+        self.poster_pixmap = QPixmap.fromImage(poster_image)
+        QPixmapCache.insert(self._poster_cache_key, self.poster_pixmap)
+        for file_path, image in ((presenter_file_path, presenter_image),
+            (qrcode_file_path, qrcode_image)):
+            key = self._pixmap_cache_key(file_path, portrait_height)
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
 
     def unload_pixmaps(self):
         """Delete the references to the pixaps, so that the Python garbage collector
@@ -168,13 +389,12 @@ class Poster:
         too many pixmaps in memory as we browse the program.
         """
         self.poster_pixmap = None
-        self.presenter_pixmap = None
-        self.qrcode_pixmap = None
+        self._set_portrait_sources(None, None, None)
 
     def pretty_print(self, max_chars=40):
         """Poster pretty print.
         """
-        title = self.short_title(max_chars)
+        title = self.short_title(max_chars).ljust(max_chars)
         return f'[{self.friendly_id:03}] {title} ({self.presenter.full_name()})'
 
     def __str__(self):
@@ -189,6 +409,8 @@ class PosterSession:
     """Poster session descriptor.
     """
 
+    __slots__ = ('id_', 'title', 'start', 'end')
+
     def __init__(self, id_: int, title: str, start: str , end: str):
         """Constructor
         """
@@ -208,10 +430,14 @@ class PosterSession:
             return None
 
     @classmethod
-    def from_df_row(cls, row):
-        """Create a PosterSession object from a dataframe row.
+    def from_data_frame(cls, data_frame) -> list:
+        """Create a list of PosterSession objects from the program data frame.
+
+        Note the columns are extracted once and zipped together, which is much
+        faster than iterating over the rows of the data frame.
         """
-        return cls(*[row[col_name] for col_name in PosterRoster.PROGRAM_COL_NAMES])
+        columns = [data_frame[col_name].tolist() for col_name in PosterRoster.PROGRAM_COL_NAMES]
+        return [cls(*args) for args in zip(*columns)]
 
     def ongoing(self, current_datetime=None) -> bool:
         """Return True if the session is ongoing.
@@ -274,37 +500,84 @@ class PosterCollectionBase:
         self.poster_folder_path = os.path.join(self.root_folder_path, self.POSTER_FOLDER_NAME)
         self.presenter_folder_path = os.path.join(self.root_folder_path, self.PRESENTER_FOLDER_NAME)
         self.qrcode_folder_path = os.path.join(self.root_folder_path, self.QRCODE_FOLDER_NAME)
+        # Note we open the workbook once, and parse all the sheets from the same
+        # handle, rather than re-reading (and unzipping) the file for each sheet.
+        self._xlsx = self._open_workbook(config_file_path)
         logger.debug('Reading %s sheet from %s...', self.PROGRAM_SHEET_NAME, config_file_path)
-        self._program_df = pd.read_excel(config_file_path, self.PROGRAM_SHEET_NAME,
-            dtype=self.PROGRAM_COL_DTYPES)
+        self._program_df = self._xlsx.parse(self.PROGRAM_SHEET_NAME,
+            usecols=list(self.PROGRAM_COL_NAMES), dtype=self.PROGRAM_COL_DTYPES)
         logger.debug('Done, %d row(s) found.', len(self._program_df))
+        # Caches for the session list, the session data frames and the content
+        # of the image folders.
+        self._session_list = None
+        self._session_data_frames = {}
+        self._folder_contents = {}
+
+    @staticmethod
+    def _open_workbook(config_file_path: str):
+        """Open the excel configuration file.
+
+        Note that, if the calamine engine is not supported by the version of
+        pandas in use, we fall back to the default engine.
+        """
+        if _EXCEL_ENGINE is not None:
+            try:
+                return pd.ExcelFile(config_file_path, engine=_EXCEL_ENGINE)
+            except ValueError as exception:
+                logger.warning('Cannot use the %s engine (%s), falling back to default...',
+                    _EXCEL_ENGINE, exception)
+        return pd.ExcelFile(config_file_path)
 
     def session_list(self):
         """Return a list with all the PosterSession objects.
 
         Note we are filtering the sessions to avoid having multiple copies of the
         same entry in the menu. This is horrible and should be streamlined.
+
+        (The list is cached at the first call.)
         """
+        if self._session_list is not None:
+            return self._session_list
         sessions = []
-        visited = []
-        for _, row in self._program_df.iterrows():
-            session = PosterSession.from_df_row(row)
+        visited = set()
+        for session in PosterSession.from_data_frame(self._program_df):
             if session.title not in visited:
-                visited.append(session.title)
+                visited.add(session.title)
                 sessions.append(session)
+        self._session_list = sessions
         return sessions
-        #return [PosterSession.from_df_row(row) for _, row in self._program_df.iterrows()]
+
+    @staticmethod
+    def _normalize_session_data_frame(data_frame):
+        """Normalize the content of a session data frame in place, and return it.
+
+        This replaces the missing affiliations with 'N/A' once and for all, so
+        that there is no need to check for NaN downstream.
+        """
+        data_frame['Affiliation'] = data_frame['Affiliation'].fillna('N/A')
+        return data_frame
 
     def session_data_frame(self, session_id):
         """Return a pandas data frame with all the data for a given session.
+
+        (The data frames are cached, for each session, at the first call.)
         """
         # pylint: disable=broad-except
+        try:
+            return self._session_data_frames[session_id]
+        except KeyError:
+            pass
         logger.info('Reading data for session %d...', session_id)
         try:
-            return pd.read_excel(self.config_file_path, str(session_id), dtype=self.SESSION_COL_DTYPES)
+            data_frame = self._xlsx.parse(str(session_id), usecols=list(self.SESSION_COL_NAMES),
+                dtype=self.SESSION_COL_DTYPES)
         except Exception as exception:
             logger.warning('Data not available for session %s: %s', session_id, exception)
-            return None
+            data_frame = None
+        else:
+            data_frame = self._normalize_session_data_frame(data_frame)
+        self._session_data_frames[session_id] = data_frame
+        return data_frame
 
     def session_poster_list(self, session_id, sort=True):
         """Return a list of Poster objects for a given session data frame.
@@ -312,7 +585,7 @@ class PosterCollectionBase:
         data_frame = self.session_data_frame(session_id)
         if data_frame is None:
             return []
-        poster_list = [Poster.from_df_row(row) for _, row in data_frame.iterrows()]
+        poster_list = Poster.from_data_frame(data_frame)
         if sort:
             poster_list.sort(key=lambda item: item.friendly_id)
         return poster_list
@@ -331,6 +604,36 @@ class PosterCollectionBase:
         """
         return f'{poster_id:03d}.png'
 
+    def folder_contents(self, folder_name: str) -> set:
+        """Return the set of the names of the files in a given folder (relative
+        to the root folder).
+
+        The folder is listed once, at the first call, which is much cheaper than
+        checking for the existence of each file separately (the listings are
+        cached until clear_folder_contents() is called).
+        """
+        try:
+            return self._folder_contents[folder_name]
+        except KeyError:
+            pass
+        folder_path = os.path.join(self.root_folder_path, folder_name)
+        try:
+            contents = set(os.listdir(folder_path))
+        except FileNotFoundError:
+            logger.warning('Could not find %s...', folder_path)
+            contents = set()
+        self._folder_contents[folder_name] = contents
+        return contents
+
+    def clear_folder_contents(self):
+        """Clear the cached listings of the image folders.
+
+        This is meant to be called when the program is reloaded, so that the
+        images added (or removed) since the folders were first listed are
+        picked up.
+        """
+        self._folder_contents.clear()
+
     def _image_path_base(self, poster_id: int, folder_name: str, default: str):
         """Generic function to build the path to the actual pixmap file for a given poster.
 
@@ -347,7 +650,7 @@ class PosterCollectionBase:
         """
         file_name = self._image_file_name(poster_id)
         file_path = os.path.join(self.root_folder_path, folder_name, file_name)
-        if not os.path.exists(file_path):
+        if file_name not in self.folder_contents(folder_name):
             logger.warning('Could not find %s...', file_path)
             return default
         return file_path
@@ -382,15 +685,27 @@ class PosterCollectionBase:
         """
         return self.qrcode_image_path(poster_id) == MISSING_QRCODE_PATH
 
+    def _poster_image_paths(self, poster):
+        """Return the paths to the poster, presenter and QR code images for a
+        given poster.
+        """
+        poster_id = poster.friendly_id
+        return self.poster_image_path(poster_id), self.presenter_image_path(poster_id),\
+            self.qrcode_image_path(poster_id)
+
     def load_poster_pixmaps(self, poster, poster_width, portrait_height):
         """Load all the necessary pixmaps for a given poster.
         """
-        poster_id = poster.friendly_id
-        poster_file_path = self.poster_image_path(poster_id)
-        presenter_file_path = self.presenter_image_path(poster_id)
-        qrcode_file_path = self.qrcode_image_path(poster_id)
-        poster.load_pixmaps(poster_file_path, presenter_file_path, qrcode_file_path,
-            poster_width, portrait_height)
+        poster.load_pixmaps(*self._poster_image_paths(poster), poster_width, portrait_height)
+
+    def load_poster_images(self, poster, poster_width, portrait_height):
+        """Load all the necessary images for a given poster.
+
+        This is the thread-safe counterpart of load_poster_pixmaps(), see
+        Poster.load_images().
+        """
+        return poster.load_images(*self._poster_image_paths(poster), poster_width,
+            portrait_height)
 
 
 
@@ -427,18 +742,20 @@ class PosterRoster(PosterCollectionBase, list):
         self.screen_id = screen_id
         self.session = None
         logger.info('Populating session list...')
-        for _, program_row in self._program_df.iterrows():
-            session = PosterSession.from_df_row(program_row)
+        for session in PosterSession.from_data_frame(self._program_df):
             if not session.ongoing(display_date):
                 continue
             logger.info('Parsing ongoing %s...', session)
             try:
-                session_df = pd.read_excel(config_file_path, f'{session.id_}')
-                for _, session_row in session_df.iterrows():
-                    poster = Poster.from_df_row(session_row)
-                    if poster.screen_id == self.screen_id:
-                        self.append(poster)
-                        self.session = session
+                session_df = self._xlsx.parse(f'{session.id_}', usecols=list(self.SESSION_COL_NAMES))
+                session_df = self._normalize_session_data_frame(session_df)
+                # Select the posters for this screen upfront, so that we only
+                # create the Poster objects that we actually need.
+                session_df = session_df[session_df['Screen ID'] == self.screen_id]
+                posters = Poster.from_data_frame(session_df)
+                if posters:
+                    self.extend(posters)
+                    self.session = session
             except ValueError as exception:
                 logger.warning('Data not available for session %s: %s', session.id_, exception)
             # The following two lines have been modified to support multiple
@@ -451,9 +768,16 @@ class PosterRoster(PosterCollectionBase, list):
 
     def load_pixmaps(self, poster_width: int, portrait_height: int):
         """Load all the poster pixmaps with the proper dimensions.
+
+        The images are decoded and scaled in parallel in a pool of worker
+        threads, and only the final (cheap) conversion to QPixmap, which is
+        only allowed in the GUI thread, is performed serially.
         """
-        for poster in self:
-            self.load_poster_pixmaps(poster, poster_width, portrait_height)
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            results = list(executor.map(lambda poster: self.load_poster_images(poster,
+                poster_width, portrait_height), self))
+        for poster, result in zip(self, results):
+            poster.set_pixmaps(*result)
 
     def __str__(self):
         """String formatting.
@@ -475,15 +799,36 @@ class PosterProgram(PosterCollectionBase, dict):
         """
         PosterCollectionBase.__init__(self, config_file_path, root_folder_path)
         dict.__init__(self, self.poster_dict())
-        self.__flattened_list = []
-        program_index = 0
         for session, posters in self.items():
-            for i, poster in enumerate(posters):
+            for session_index, poster in enumerate(posters):
                 poster.session = session
-                poster.program_index = program_index
-                poster.session_index = i
-                program_index += 1
-                self.__flattened_list.append(poster)
+                poster.session_index = session_index
+        self.__flattened_list = list(itertools.chain.from_iterable(self.values()))
+        for program_index, poster in enumerate(self.__flattened_list):
+            poster.program_index = program_index
+        # Cache the friendly ids of all the posters with an image on disk.
+        self.present_ids = self._present_image_ids(self.POSTER_FOLDER_NAME)
+
+    def clear_folder_contents(self):
+        """Overloaded method.
+
+        Note the set of the posters with an image on disk is refreshed, too.
+        """
+        super().clear_folder_contents()
+        self.present_ids = self._present_image_ids(self.POSTER_FOLDER_NAME)
+
+    def _present_image_ids(self, folder_name: str) -> set:
+        """Return the set of the poster friendly ids for which an image exists
+        in a given folder.
+
+        This is meant to replace repeated calls to the missing_*_image() methods.
+        Note only the posters in the program are considered, and their images
+        are looked up with the very same file names that are actually loaded
+        (see _image_file_name()).
+        """
+        contents = self.folder_contents(folder_name)
+        return {poster.friendly_id for poster in self.__flattened_list \
+            if self._image_file_name(poster.friendly_id) in contents}
 
     def select_by_program_index(self, index):
         """Select a poster by program index.
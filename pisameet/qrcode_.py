@@ -17,21 +17,35 @@
 """QR-code facilities.
 """
 
+import multiprocessing
 import os
 
 import qrcode
+try:
+    import segno
+except ImportError:
+    segno = None
 
 from pisameet import logger, MISSING_QRCODE_PATH
 
 
 def generate_qrcode(data, file_path, overwrite=False):
     """Generate a qrcode for a given input data.
+
+    If segno is available, it is used to write a 1-bit png file directly, which
+    is much faster (and yields much smaller files) than going through the
+    full RGB image from the qrcode package.
     """
     if os.path.exists(file_path) and overwrite is False:
         logger.info('File %s exists, skipping...', file_path)
-        return 
+        return
     #pylint: disable=invalid-name
     logger.info('Generating QR code for "%s"...', data)
+    if segno is not None:
+        logger.info('Saving file to %s...', file_path)
+        segno.make(data, micro=False).save(file_path, scale=10, border=0)
+        logger.info('Done.')
+        return
     qr = qrcode.QRCode(version=1, box_size=10, border=0)
     qr.add_data(data)
     qr.make(fit=True)
@@ -39,3 +53,31 @@ def generate_qrcode(data, file_path, overwrite=False):
     logger.info('Saving file to %s...', file_path)
     img.save(file_path)
     logger.info('Done.')
+
+
+def generate_qrcodes(pairs, processes=None, chunksize=16):
+    """Generate a batch of qrcodes in parallel in a pool of worker processes.
+
+    Since the encoding is CPU-bound and each code is independent from the others,
+    this scales linearly with the number of cores. Note the check for existing
+    files is performed in the workers, so that the no-op cases stay cheap.
+
+    Arguments
+    ---------
+    pairs : iterable of (data, file_path) tuples
+        The input data and the output file path for each qrcode.
+
+    processes : int, optional
+        The number of worker processes (defaults to the number of cores).
+
+    chunksize : int
+        The number of tasks dispatched to each worker at a time.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return
+    if processes is None:
+        processes = os.cpu_count()
+    logger.info('Generating %d QR code(s) with %d process(es)...', len(pairs), processes)
+    with multiprocessing.Pool(processes) as pool:
+        pool.starmap(generate_qrcode, pairs, chunksize=chunksize)
@@ -15,18 +15,41 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 """Rasterization tools.
+
+Note the resizing is done with PIL, and the Lanczos resampling is by far the
+largest CPU cost when rastering posters. Pillow-SIMD (https://github.com/uploadcare/pillow-simd)
+is a drop-in replacement for Pillow (i.e., it exposes the same PIL namespace)
+with vectorized resampling kernels, and can be used in the deployment
+environment with no code change, e.g.
+
+pip uninstall pillow
+CC="cc -mavx2" pip install -U --force-reinstall pillow-simd
+
+(a Pillow-SIMD build can be recognized by PIL.__version__ ending in .postN).
 """
 
+import atexit
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import pathlib
 import subprocess
 import sys
 
 import cv2
 from loguru import logger
 import numpy as np
-import pdfrw
 import PIL
 import PIL.Image
+import PIL.ImageOps
+
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
 
 from pisameet import PISAMEET_DATA
 
@@ -37,14 +60,65 @@ logger.remove()
 logger.add(**DEFAULT_LOGURU_HANDLER)
 
 REFERENCE_DENSITY = 72.
-EXIF_ORIENTATION_TAG = 274
-EXIF_ROTATION_DICT = {3: 180, 6: 270, 8: 90}
+# Use a fast (but less effective) png compression for the rastered files. The
+# output files can be recompressed once, before the distribution, with optimize_pngs().
+FAST_PNG = True
+PNG_COMPRESSION_LEVEL = 1 if FAST_PNG else 6
 HAARCASCADE_FILE_PATH = os.path.join(PISAMEET_DATA, 'haarcascade_frontalface_default.xml')
+# Optional files for the opencv DNN face detector (not shipped with the package).
+DNN_MODEL_FILE_PATH = os.path.join(PISAMEET_DATA, 'opencv_face_detector_uint8.pb')
+DNN_CONFIG_FILE_PATH = os.path.join(PISAMEET_DATA, 'opencv_face_detector.pbtxt')
+
+# Persistent cache of the face bounding boxes, indexed by the hash of the content
+# of the input file, along with the face detector and its parameters.
+_FACE_BBOX_CACHE_PATH = os.path.join(PISAMEET_DATA, '.face_bbox_cache.json')
+_face_bbox_cache = None
+_face_bbox_cache_dirty = False
+# New entries added to the cache in the current process, which worker processes
+# pass back to the parent (see crop_to_face_batch()).
+_face_bbox_cache_updates = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_page_size(file_path: str, mtime: float, page_number: int) -> tuple[int, int]:
+    """Cached implementation of pdf_page_size().
+
+    Note the modification time of the file is part of the cache key, so that
+    the cache is invalidated if the file changes on disk.
+    """
+    # pylint: disable=unused-argument
+    logger.debug(f'Retrieving page {page_number} size from {file_path}...')
+    if pypdfium2 is not None:
+        # pdfium only parses the cross-reference table and the target page.
+        document = pypdfium2.PdfDocument(file_path)
+        try:
+            width, height = document.get_page_size(page_number)
+        finally:
+            document.close()
+        logger.debug(f'Page size: ({width}, {height}).')
+        return width, height
+    # pdfrw is imported here (and not at the module level), so that we do not pay
+    # the import cost when pypdfium2 is available.
+    # pylint: disable=import-outside-toplevel
+    import pdfrw
+    document = pdfrw.PdfReader(fdata=pathlib.Path(file_path).read_bytes())
+    page = document.pages[page_number]
+    # This is a list of strings, e.g., ['0', '0', '1683.72', '2383.92']...
+    bbox = page.MediaBox or page.Parent.MediaBox
+    # ... which we convert to a list of float, e.g., [0, 0, 1683.72, 2383.92]
+    bbox = [float(val) for val in bbox]
+    width = bbox[2] - bbox[0]
+    height = bbox[3] - bbox[1]
+    logger.debug(f'Page size: ({width}, {height}).')
+    return width, height
 
 
 def pdf_page_size(file_path: str, page_number: int=0) -> tuple[int, int]:
     """Return the page size for a given page of a given pdf document.
 
+    The values are cached, and the document is read with pypdfium2, when
+    available, which does not need to parse the whole file.
+
     Arguments
     ---------
     file_path : str
@@ -55,24 +129,58 @@ def pdf_page_size(file_path: str, page_number: int=0) -> tuple[int, int]:
     """
     if not file_path.endswith('.pdf'):
         raise RuntimeError(f'{file_path} not a pdf file?')
-    logger.debug(f'Retrieving page {page_number} size from {file_path}...')
-    document = pdfrw.PdfReader(file_path)
-    page = document.pages[page_number]
-    # This is a list of strings, e.g., ['0', '0', '1683.72', '2383.92']...
-    bbox = page.MediaBox or page.Parent.MediaBox
-    # ... which we convert to a list of float, e.g., [0, 0, 1683.72, 2383.92]
-    bbox = [float(val) for val in bbox]
-    width = bbox[2] - bbox[0]
-    height = bbox[3] - bbox[1]
-    logger.debug(f'Page size: ({width}, {height}).')
-    return width, height
+    return _pdf_page_size(file_path, os.path.getmtime(file_path), page_number)
+
+
+def up_to_date(input_file_path: str, output_file_path: str, input_mtime: float = None,
+    output_mtime: float = None) -> bool:
+    """Return True if the output file exists and is not older than the input file.
+
+    Arguments
+    ---------
+    input_file_path : str
+        The path to the input file.
+
+    output_file_path : str
+        The path to the output file.
+
+    input_mtime : float
+        The modification time of the input file, if already known (e.g., from a
+        directory listing), in which case the file is not stat()-ed again.
+
+    output_mtime : float
+        The modification time of the output file, if already known.
+    """
+    try:
+        if input_mtime is None:
+            input_mtime = os.path.getmtime(input_file_path)
+        if output_mtime is None:
+            output_mtime = os.path.getmtime(output_file_path)
+    except FileNotFoundError:
+        return False
+    return output_mtime >= input_mtime
+
+
+def _render_pdf(input_file_path: str, density: float = REFERENCE_DENSITY):
+    """Render the first page of a pdf file in memory, and return it as a PIL image.
+
+    Note this requires pypdfium2.
+    """
+    document = pypdfium2.PdfDocument(input_file_path)
+    try:
+        return document[0].render(scale=density / REFERENCE_DENSITY).to_pil()
+    finally:
+        document.close()
 
 
 def pdf_to_png(input_file_path: str, output_file_path: str, density: float = REFERENCE_DENSITY,
-    compression_level: int = 0) -> str:
-    """Convert a .pdf file to a .png file using imagemagick convert under the hood.
+    compression_level: int = 1, overwrite: bool = True) -> str:
+    """Convert a .pdf file to a .png file.
 
-    See https://imagemagick.org/script/command-line-options.php for some basic
+    If pypdfium2 is available, the first page of the document is rendered in
+    process, which avoids the overhead of spawning an external process for
+    each file. Otherwise we fall back to imagemagick convert, see
+    https://imagemagick.org/script/command-line-options.php for some basic
     information about convert's internals.
 
     Arguments
@@ -85,10 +193,21 @@ def pdf_to_png(input_file_path: str, output_file_path: str, density: float = REF
 
     density : int
         The density (in dpi) to be passed to convert.
+
+    overwrite : bool
+        If False, the conversion is skipped when the output file is newer than
+        the input file.
     """
     if not input_file_path.endswith('.pdf'):
         raise RuntimeError(f'{input_file_path} not a pdf file?')
+    if not overwrite and up_to_date(input_file_path, output_file_path):
+        logger.info(f'Output file {output_file_path} is up to date, skipping...')
+        return output_file_path
     logger.info(f'Converting {input_file_path} to {output_file_path} @{density:.3f} dpi...')
+    if pypdfium2 is not None:
+        _render_pdf(input_file_path, density).save(output_file_path,
+            compress_level=compression_level)
+        return output_file_path
     subprocess.run(['convert', '-density', f'{density}', '-define',
         f'png:compression-level={compression_level}', input_file_path, output_file_path],
         check=True)
@@ -96,15 +215,37 @@ def pdf_to_png(input_file_path: str, output_file_path: str, density: float = REF
 
 
 def resize_image(img, width, height, output_file_path=None, resample=PIL.Image.LANCZOS,
-    reducing_gap=3., compression_level=6):
+    reducing_gap=2., compression_level=PNG_COMPRESSION_LEVEL, backend='pil'):
     """Base function to resize an image.
+
+    By default the resizing is done by PIL. If backend is 'cv2', opencv is used,
+    instead (with INTER_AREA interpolation for downscaling and INTER_LANCZOS4 for
+    upscaling), which is typically faster, as the underlying kernels are
+    vectorized. (Note that resample and reducing_gap are ignored, in this case.)
+
+    With PIL, the image is first reduced by an integer factor with a fast box
+    filter, so that the Lanczos pass works on an image at most reducing_gap times
+    larger than the target.
     """
     w, h = img.size
     logger.info(f'Resizing image ({w}, {h}) -> ({width}, {height})...')
-    img = img.resize((width, height), resample, None, reducing_gap)
+    if backend == 'cv2':
+        if img.mode not in ('L', 'RGB', 'RGBA'):
+            img = img.convert('RGB')
+        if width * height < w * h:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LANCZOS4
+        data = cv2.resize(np.asarray(img), (width, height), interpolation=interpolation)
+        img = PIL.Image.fromarray(data)
+    elif backend == 'pil':
+        img = img.resize((width, height), resample, None, reducing_gap)
+    else:
+        raise RuntimeError(f'Invalid resize backend {backend}')
     if output_file_path is not None:
         logger.info(f'Saving image to {output_file_path}...')
         img.save(output_file_path, compress_level=compression_level)
+    return img
 
 
 def png_resize_to_width(input_file_path: str, output_file_path: str, width: int, **kwargs):
@@ -125,59 +266,107 @@ def png_resize_to_height(input_file_path: str, output_file_path: str, height: in
         resize_image(img, width, height, output_file_path, **kwargs)
 
 
+def horizontal_autocrop(img, threshold: float = 0.99, padding: float = 0.001,
+    max_aspect_ratio=1.52):
+    """Crop the white margins on the left and right of an image, and return the
+    cropped image.
+    """
+    logger.debug('Decoding image data...')
+    width, height = img.size
+    # Calculate the average (summed) RGB value for each column in a single
+    # reduction over the rows and the channels---note we need a wider integer
+    # type for the accumulator, to avoid overflows.
+    rgb = img if img.mode == 'RGB' else img.convert('RGB')
+    hist = np.asarray(rgb).sum(axis=(0, 2), dtype=np.uint32).astype(np.float32)
+    hist /= height
+    threshold *= hist.max()
+    padding = int(padding * width + 1)
+    mask = hist > threshold
+    edges = np.flatnonzero(mask[1:] != mask[:-1])
+    if edges.size == 0:
+        logger.warning('No edges found, skipping the crop...')
+        return img
+    xmin = max(edges.min() - padding, 0)
+    xmax = min(edges.max() + padding + 1, width)
+    deltax = (xmax - xmin)
+    if height / deltax > max_aspect_ratio:
+        logger.warning(f'Cropped width ({deltax}) exceeds maximum aspect ratio')
+        pad = int(0.5 * (height / max_aspect_ratio - deltax))
+        logger.debug(f'Padding back by {pad} pixels...')
+        xmin -= pad
+        xmax += pad
+    ratio = deltax / width
+    logger.debug(f'Horizontal compression ratio: {ratio:.3f}')
+    bbox = (xmin, 0, xmax, height)
+    logger.debug(f'Target bounding box: {bbox}')
+    return img.crop(bbox)
+
+
 def png_horizontal_autocrop(input_file_path: str, output_file_path: str,
-    threshold: float = 0.99, padding: float = 0.001, compression_level=6, max_aspect_ratio=1.52):
+    threshold: float = 0.99, padding: float = 0.001, compression_level=1, max_aspect_ratio=1.52):
     """
     """
     logger.info(f'Cropping image {input_file_path}...')
     with PIL.Image.open(input_file_path) as img:
-        logger.debug('Decoding image data...')
-        width, height = img.size
-        channel = lambda ch: np.array(img.getdata(0)).reshape((height, width))
-        data = sum(channel(ch) for ch in (0, 1, 2))
-        threshold *= data.max()
-        padding = int(padding * width + 1)
-        hist = data.mean(axis=0)
-        edges, = np.where(np.diff(hist > threshold))
-        xmin = max(edges.min() - padding, 0)
-        xmax = min(edges.max() + padding + 1, width)
-        deltax = (xmax - xmin)
-        if height / deltax > max_aspect_ratio:
-            logger.warning(f'Cropped width ({deltax}) exceeds maximum aspect ratio')
-            pad = int(0.5 * (height / max_aspect_ratio - deltax))
-            logger.debug(f'Padding back by {pad} pixels...')
-            xmin -= pad
-            xmax += pad
-        ratio = deltax / width
-        logger.debug(f'Horizontal compression ratio: {ratio:.3f}')
-        bbox = (xmin, 0, xmax, height)
-        logger.debug(f'Target bounding box: {bbox}')
-        img = img.crop(bbox)
+        img = horizontal_autocrop(img, threshold, padding, max_aspect_ratio)
         logger.info(f'Saving cropped image to {output_file_path}')
         img.save(output_file_path, compress_level=compression_level)
 
 
-def png_horizontal_padding(input_file_path: str, output_file_path: str, aspect_ratio=1.50):
+def horizontal_padding(img, aspect_ratio=1.50):
+    """Pad an image with white on the left and right to the target aspect ratio,
+    and return the padded image.
+    """
+    width, height = img.size
+    target_width = int(height / aspect_ratio)
+    delta = target_width - width
+    logger.debug(f'Padding to {target_width} x {height}...')
+    output = PIL.Image.new(img.mode, (target_width, height), (255, 255, 255))
+    output.paste(img, (delta // 2, 0))
+    return output
+
+
+def png_horizontal_padding(input_file_path: str, output_file_path: str, aspect_ratio=1.50,
+    compression_level=1):
     """
     """
     logger.info(f'Padding image {input_file_path}...')
     with PIL.Image.open(input_file_path) as img:
-        width, height = img.size
-        target_width = int(height / aspect_ratio)
-        delta = target_width - width
-        logger.debug(f'Padding to {target_width} x {height}...')
-        output = PIL.Image.new(img.mode, (target_width, height), (255, 255, 255))
-        output.paste(img, (delta // 2, 0))
-        output.save(output_file_path)
+        output = horizontal_padding(img, aspect_ratio)
+        output.save(output_file_path, compress_level=compression_level)
+
+
+def _pdf_to_image(input_file_path: str, density: float):
+    """Raster the first page of a pdf file and return it as a PIL image.
+
+    This is done in process if pypdfium2 is available. Otherwise convert writes
+    the png to its standard output, and the image is decoded from an in-memory
+    buffer, so that no intermediate file is written to disk in either case.
+    """
+    if pypdfium2 is not None:
+        return _render_pdf(input_file_path, density)
+    logger.info(f'Converting {input_file_path} @{density:.3f} dpi...')
+    data = subprocess.run(['convert', '-density', f'{density}', '-define',
+        'png:compression-level=1', input_file_path, 'png:-'],
+        check=True, capture_output=True).stdout
+    with PIL.Image.open(io.BytesIO(data)) as img:
+        img.load()
+        return img
 
 
 def raster_pdf(input_file_path: str, output_file_path: str, target_width: int,
     intermediate_width: int = None, overwrite: bool = False, autocrop: bool = False,
     max_aspect_ratio=1.52) -> str:
     """Raster a pdf file and convert it to a png.
+
+    The intermediate image is cropped and resized in memory, and the output
+    file is written only once.
+
+    Unless overwrite is True, the file is skipped if the output is newer than the
+    input, so that only the pdf files that changed since the last run are processed.
     """
-    if os.path.exists(output_file_path) and not overwrite:
-        logger.info(f'Output file {output_file_path} exists, skipping...')
+    if not overwrite and up_to_date(input_file_path, output_file_path):
+        logger.info(f'Output file {output_file_path} is up to date, skipping...')
         return
     logger.info(f'Rastering {input_file_path}...')
     original_width, original_height = pdf_page_size(input_file_path)
@@ -189,31 +378,299 @@ def raster_pdf(input_file_path: str, output_file_path: str, target_width: int,
         return pdf_to_png(input_file_path, output_file_path, density)
     logger.debug('Performing intermediate rastering...')
     density = intermediate_width / original_width * REFERENCE_DENSITY
-    file_path = pdf_to_png(input_file_path, output_file_path, density)
+    # Crop and resize in memory, and write the final image once.
+    img = _pdf_to_image(input_file_path, density)
     if autocrop:
-        png_horizontal_autocrop(file_path, file_path)
+        img = horizontal_autocrop(img)
     elif aspect_ratio > max_aspect_ratio:
         logger.warning(f'Aspect ratio ({aspect_ratio:.3f}) is too large for {input_file_path}!')
-        png_horizontal_padding(file_path, file_path)
+        img = horizontal_padding(img)
     logger.debug('Resizing to target width...')
-    return png_resize_to_width(file_path, file_path, target_width)
+    w, h = img.size
+    resize_image(img, target_width, round(target_width / w * h), output_file_path)
+    return output_file_path
+
+
+def optimize_pngs(folder_path: str, level: int = 2):
+    """Losslessly recompress all the png files in a given folder with oxipng.
+
+    This is meant to be run once, before the distribution, to reclaim the space
+    lost by the fast compression used when rastering (see FAST_PNG). Note that
+    oxipng processes the files in parallel, and that it is an external program
+    (https://github.com/shssoichiro/oxipng) that needs to be installed and in
+    the PATH.
+    """
+    logger.info(f'Optimizing png files in {folder_path}...')
+    subprocess.run(['oxipng', '-o', f'{level}', '-r', '--strip', 'safe', folder_path],
+        check=True)
+
+
+def _raster_pdf_task(args):
+    """Small wrapper around raster_pdf() to be mapped over a pool of worker processes.
+    """
+    return raster_pdf(*args)
+
+
+def raster_pdfs(tasks, jobs: int = None, chunksize: int = 1):
+    """Run raster_pdf() on a list of input files in a pool of worker processes.
+
+    The rastering is CPU-bound (be it in process or through convert) and the
+    files are independent from each other, so this scales with the number of cores.
+
+    Arguments
+    ---------
+    tasks : iterable
+        The arguments for the raster_pdf() calls, each in the form of a
+        (input_file_path, output_file_path, target_width, intermediate_width,
+        overwrite, autocrop) tuple---this can be a generator.
+
+    jobs : int
+        The number of worker processes (defaults to the number of cores).
+
+    chunksize : int
+        The number of tasks dispatched to a worker process at once.
+    """
+    # Note imap_unordered() consumes the tasks lazily and the results are
+    # collected in completion order, so that a slow file does not hold back
+    # the dispatch of the following ones.
+    with multiprocessing.Pool(jobs or os.cpu_count()) as pool:
+        for _ in pool.imap_unordered(_raster_pdf_task, tasks, chunksize=chunksize):
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _face_cascade():
+    """Return the opencv cascade classifier for the face detection.
+
+    The classifier is created (and the underlying .xml file parsed) at the
+    first call, and cached afterwards.
+    """
+    logger.debug(f'Loading cascade classifier from {HAARCASCADE_FILE_PATH}...')
+    return cv2.CascadeClassifier(HAARCASCADE_FILE_PATH)
+
+
+def _load_face_bbox_cache():
+    """Load the face bounding-box cache from disk (this is done lazily at the first call).
+    """
+    # pylint: disable=global-statement, broad-except
+    global _face_bbox_cache
+    _face_bbox_cache = {}
+    if os.path.exists(_FACE_BBOX_CACHE_PATH):
+        logger.debug(f'Loading face bounding-box cache from {_FACE_BBOX_CACHE_PATH}...')
+        try:
+            with open(_FACE_BBOX_CACHE_PATH) as input_file:
+                _face_bbox_cache = json.load(input_file)
+        except Exception as exception:
+            logger.warning(f'Could not read {_FACE_BBOX_CACHE_PATH}: {exception}')
+    atexit.register(_dump_face_bbox_cache)
+
+
+def _dump_face_bbox_cache():
+    """Write the face bounding-box cache back to disk, if anything changed.
+    """
+    if not _face_bbox_cache_dirty:
+        return
+    logger.debug(f'Writing face bounding-box cache to {_FACE_BBOX_CACHE_PATH}...')
+    with open(_FACE_BBOX_CACHE_PATH, 'w') as output_file:
+        json.dump(_face_bbox_cache, output_file)
+
+
+def _update_face_bbox_cache(entries: dict):
+    """Add a set of entries to the face bounding-box cache.
+    """
+    # pylint: disable=global-statement
+    global _face_bbox_cache_dirty
+    if _face_bbox_cache is None:
+        _load_face_bbox_cache()
+    _face_bbox_cache.update(entries)
+    _face_bbox_cache_updates.update(entries)
+    _face_bbox_cache_dirty = True
+
+
+def _face_bbox_cache_key(data: bytes, min_frac_size: float, padding: float) -> str:
+    """Return the key for the face bounding-box cache for a given file content.
+
+    The key includes the face detector in use (that is, whether the DNN model
+    files are available) and the detection parameters, so that changing any of
+    them does not serve stale bounding boxes from the cache.
+    """
+    detector = 'dnn' if os.path.exists(DNN_MODEL_FILE_PATH) and \
+        os.path.exists(DNN_CONFIG_FILE_PATH) else 'haar'
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    return f'{detector}:{min_frac_size}:{padding}:{digest}'
+
+
+def cached_face_bbox(file_path: str, data: bytes, img: PIL.Image.Image,
+    min_frac_size: float = 0.145, padding: float = 1.85):
+    """Return the face bounding box for a given file, running the face detection
+    on the corresponding image only if the result is not cached.
+
+    The results are cached on disk, keyed by a hash of the content of the file
+    (see _face_bbox_cache_key()), so that the face detection is not run again on
+    unchanged pictures when the preprocessing is re-run.
+
+    Arguments
+    ---------
+    file_path : str
+        The path to the input file (only used for logging purposes).
+
+    data : bytes
+        The content of the input file.
+
+    img : PIL.Image.Image
+        The decoded image---this is converted to grayscale only on a cache miss.
+
+    min_frac_size : float
+        The minimum size of the face, relative to the image size.
+
+    padding : float
+        The padding factor for the bounding box around the face.
+    """
+    if _face_bbox_cache is None:
+        _load_face_bbox_cache()
+    key = _face_bbox_cache_key(data, min_frac_size, padding)
+    if key in _face_bbox_cache:
+        logger.debug(f'Face bounding box for {file_path} found in cache.')
+        return tuple(_face_bbox_cache[key])
+    logger.info(f'Running face detection on {file_path}...')
+    bbox = face_bbox_from_array(np.asarray(img.convert('L')), min_frac_size, padding)
+    _update_face_bbox_cache({key: [int(val) for val in bbox]})
+    return bbox
+
+
+def _detect_faces(cascade, img: np.ndarray, **kwargs):
+    """Run the detectMultiScale() method of a cascade classifier on a given image.
+
+    If OpenCL is available, the image is wrapped into a cv2.UMat object, so that
+    opencv can take the accelerated code path, and we fall back to the plain
+    CPU code path if anything goes wrong.
+    """
+    if cv2.ocl.haveOpenCL():
+        try:
+            return cascade.detectMultiScale(cv2.UMat(img), **kwargs)
+        except cv2.error as exception:
+            logger.warning(f'OpenCL face detection failed ({exception}), falling back to CPU...')
+    return cascade.detectMultiScale(img, **kwargs)
+
+
+def _haar_faces(img: np.ndarray, min_frac_size: float, max_detection_size: int,
+    min_face_size: int = 48):
+    """Run the Haar cascade face detection on a grayscale image and return the
+    list of the candidate (x, y, w, h) rectangles.
+
+    Images larger than max_detection_size are downscaled before the detection,
+    and the result mapped back to the original coordinates. Since the cost of
+    the detection scales with the number of pixels, and the minimum face size
+    is a sizable fraction of the image, the image is further downscaled as long
+    as the minimum face size stays above min_face_size pixels (i.e., twice the
+    24-pixel size of the Haar detection window, by default).
+    """
+    cascade = _face_cascade()
+    height, width = img.shape
+    scale = min(max_detection_size / max(width, height),
+        min_face_size / (min_frac_size * min(width, height)))
+    if scale < 1.:
+        logger.debug(f'Downscaling image by {scale:.3f} for the face detection...')
+        small = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    else:
+        scale = 1.
+        small = img
+    small_height, small_width = small.shape
+    min_size = round(small_width * min_frac_size), round(small_height * min_frac_size)
+    faces = _detect_faces(cascade, small, scaleFactor=1.1, minNeighbors=5, minSize=min_size)
+    if len(faces) > 0 and scale < 1.:
+        faces = [[round(val / scale) for val in face] for face in faces]
+    return faces
+
+
+@functools.lru_cache(maxsize=1)
+def _face_net():
+    """Return the opencv DNN face detector, or None if the model files are not
+    available in the data folder.
+
+    The network is loaded at the first call, and cached afterwards.
+    """
+    if not os.path.exists(DNN_MODEL_FILE_PATH) or not os.path.exists(DNN_CONFIG_FILE_PATH):
+        logger.debug('DNN face detector not available, using the Haar cascade classifier...')
+        return None
+    logger.debug(f'Loading DNN face detector from {DNN_MODEL_FILE_PATH}...')
+    return cv2.dnn.readNetFromTensorflow(DNN_MODEL_FILE_PATH, DNN_CONFIG_FILE_PATH)
+
+
+def _dnn_faces(net, img: np.ndarray, min_confidence: float = 0.7):
+    """Run the DNN face detection on a grayscale image and return a list with
+    the (x, y, w, h) rectangle for the highest-confidence face (or an empty
+    list, if no face is found above the minimum confidence).
+
+    Note the network runs on a fixed 300 x 300 input blob, independently of the
+    size of the input image.
+    """
+    height, width = img.shape
+    blob = cv2.dnn.blobFromImage(cv2.cvtColor(img, cv2.COLOR_GRAY2BGR), 1.0, (300, 300),
+        [104, 117, 123], False, False)
+    net.setInput(blob)
+    # Each detection is [image_id, label, confidence, x1, y1, x2, y2], with the
+    # coordinates normalized to the image size.
+    detections = net.forward()[0, 0]
+    best = None
+    for detection in detections:
+        if detection[2] >= min_confidence and (best is None or detection[2] > best[2]):
+            best = detection
+    if best is None:
+        return []
+    logger.debug(f'DNN face found with confidence {best[2]:.3f}')
+    x1, y1, x2, y2 = best[3:7] * np.array([width, height, width, height])
+    x1, y1 = max(round(x1), 0), max(round(y1), 0)
+    x2, y2 = min(round(x2), width - 1), min(round(y2), height - 1)
+    return [[x1, y1, x2 - x1, y2 - y1]]
 
 
 def face_bbox(file_path: str, min_frac_size: float = 0.145, padding: float = 1.85):
     """Run a simple opencv face detection and return the proper bounding box for
     cropping the input image.
 
+    This is a thin wrapper around face_bbox_from_array(), reading the image
+    from file.
+    """
+    logger.info(f'Running face detection on {file_path}...')
+    # Decode straight to grayscale, rather than converting after the fact.
+    img = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
+    return face_bbox_from_array(img, min_frac_size, padding)
+
+
+def face_bbox_from_array(img: np.ndarray, min_frac_size: float = 0.145, padding: float = 1.85,
+    max_detection_size: int = 1000):
+    """Run a simple opencv face detection on an image already loaded in memory
+    and return the proper bounding box for cropping it.
+
     This is returning an approximately square (modulo 1 pixel possible difference
     between the two sides) bounding box containing the face.
+
+    Arguments
+    ---------
+    img : np.ndarray
+        The grayscale image, as a two-dimensional array.
+
+    min_frac_size : float
+        The minimum size of the face, relative to the image size.
+
+    padding : float
+        The padding factor for the bounding box around the face.
+
+    max_detection_size : int
+        The maximum size (in pixels) of the longest side of the image the Haar
+        face detection is run on---larger images are downscaled before the
+        detection, and the result mapped back to the original coordinates.
     """
-    logger.info(f'Running face detection on {file_path}...')
-    # Run opencv and find the face.
-    cascade = cv2.CascadeClassifier(HAARCASCADE_FILE_PATH)
-    img = cv2.imread(file_path)
-    img = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    # Run opencv and find the face---using the DNN face detector, if available,
+    # and the Haar cascade classifier otherwise (or if the former fails).
     height, width = img.shape
-    min_size = round(width * min_frac_size), round(height * min_frac_size)
-    faces = cascade.detectMultiScale(img, scaleFactor=1.1, minNeighbors=5, minSize=min_size)
+    faces = []
+    net = _face_net()
+    if net is not None:
+        faces = _dnn_faces(net, img)
+    if len(faces) == 0:
+        faces = _haar_faces(img, min_frac_size, max_detection_size)
     if len(faces) == 0:
         logger.warning('No candidate face found, returning dummy bounding box...')
         x0, y0 = width // 2, height // 2
@@ -255,35 +712,81 @@ def face_bbox(file_path: str, min_frac_size: float = 0.145, padding: float = 1.8
 
 
 def crop_to_face(file_path: str, output_file_path: str, height: int,
-    overwrite: bool = False, bbox=None, **kwargs):
+    overwrite: bool = False, bbox=None, compression_level=1, **kwargs):
     """Resize a given input file to contain the face.
+
+    Note the output images are tiny, and we use a fast compression level for
+    the png encoding by default.
+
+    Unless overwrite is True, the file is skipped if the output is newer than the
+    input, so that only the pictures that changed since the last run are processed.
     """
-    if os.path.exists(output_file_path) and not overwrite:
-        logger.info(f'Output file {output_file_path} exists, skipping...')
+    if not overwrite and up_to_date(file_path, output_file_path):
+        logger.info(f'Output file {output_file_path} is up to date, skipping...')
         return
     logger.info(f'Cropping {file_path} to face...')
-    kwargs.setdefault('resample', PIL.Image.ANTIALIAS)
-    kwargs.setdefault('reducing_gap', 3.)
+    kwargs.setdefault('resample', PIL.Image.LANCZOS)
+    kwargs.setdefault('reducing_gap', 2.)
+    # Read the file once, as the content is needed both for the decoding and for
+    # the lookup in the face bounding-box cache.
+    with open(file_path, 'rb') as input_file:
+        data = input_file.read()
     try:
-        with PIL.Image.open(file_path) as img:
-            # Parse the original image size and orientation.
+        with PIL.Image.open(io.BytesIO(data)) as img:
             w, h = img.size
-            orientation = img.getexif().get(EXIF_ORIENTATION_TAG, None)
-            logger.debug(f'Original size: {w} x {h}, orientation: {orientation}')
-            # If the image is rotated, we need to change the orientation.
-            if orientation in EXIF_ROTATION_DICT:
-                rotation = EXIF_ROTATION_DICT[orientation]
-                logger.debug(f'Applying a rotation by {rotation} degrees...')
-                img = img.rotate(rotation, expand=True)
-                w, h = img.size
-                logger.debug(f'Rotated size: {w} x {h}')
-            # Crop and scale to the target dimensions.
+            logger.debug(f'Original size: {w} x {h}')
+            # If the image is rotated (or flipped), according to the EXIF
+            # orientation tag, we need to normalize the orientation.
+            img = PIL.ImageOps.exif_transpose(img)
+            # Crop and scale to the target dimensions. Note that the face detection
+            # (if needed at all) runs on the image that we have already decoded
+            # (and rotated), rather than reading the file for a second time.
             if bbox is None:
-                bbox = face_bbox(file_path)
+                bbox = cached_face_bbox(file_path, data, img)
             logger.info(f'Resizing image to ({height}, {height})...')
             img = img.resize((height, height), box=bbox, **kwargs)
             if output_file_path is not None:
                 logger.info(f'Saving image to {output_file_path}...')
-                img.save(output_file_path)
+                img.save(output_file_path, compress_level=compression_level, optimize=False)
     except PIL.UnidentifiedImageError as exception:
         logger.error(exception)
+
+
+def _crop_to_face_task(args):
+    """Small wrapper around crop_to_face() unpacking the arguments, to be used
+    in a pool of worker processes.
+
+    Since the worker processes do not write the face bounding-box cache to disk,
+    this returns the new cache entries, to be merged in the parent process.
+    """
+    _face_bbox_cache_updates.clear()
+    crop_to_face(*args)
+    return dict(_face_bbox_cache_updates)
+
+
+def crop_to_face_batch(tasks, jobs: int = None, chunksize: int = 4):
+    """Run crop_to_face() on a list of input files in a pool of worker processes.
+
+    The decoding and the face detection are CPU-bound and the files are
+    independent from each other, so this scales with the number of cores.
+
+    Arguments
+    ---------
+    tasks : iterable
+        The arguments for the crop_to_face() calls, each in the form of a
+        (file_path, output_file_path, height, overwrite, bbox) tuple.
+
+    jobs : int
+        The number of worker processes (defaults to the number of cores).
+
+    chunksize : int
+        The number of tasks dispatched to a worker process at once.
+    """
+    # Load the face bounding-box cache before the worker processes are started,
+    # so that it is shared with them, where possible.
+    if _face_bbox_cache is None:
+        _load_face_bbox_cache()
+    with multiprocessing.Pool(jobs or os.cpu_count()) as pool:
+        for updates in pool.imap_unordered(_crop_to_face_task, tasks, chunksize=chunksize):
+            if updates:
+                _update_face_bbox_cache(updates)
@@ -21,11 +21,9 @@ import os
 import shutil
 import sys
 
-import pdfrw
-
 from pisameet import logger, PISAMEET_BASE
 from pisameet.indico import retrieve_info, ConferenceInfo
-from pisameet.dispatch import dispatch_posters, dispatch_pictures
+from pisameet.dispatch import dispatch_all
 from pisameet.process import crawl
 from pisameet.qrcode_ import generate_qrcode
 
@@ -115,5 +113,4 @@ def dispatch_files():
         if not os.path.exists(folder_path):
             logger.info('Creating folder %s...' % folder_path)
             os.makedirs(folder_path)
-    dispatch_posters(ids, INDICO_ATTACHMENTS_FOLDER_PATH, POSTER_FOLDER_PATH)
-    dispatch_pictures(ids, INDICO_ATTACHMENTS_FOLDER_PATH, PRESENTER_FOLDER_PATH)
+    dispatch_all(ids, INDICO_ATTACHMENTS_FOLDER_PATH, POSTER_FOLDER_PATH, PRESENTER_FOLDER_PATH)
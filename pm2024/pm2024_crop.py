@@ -20,13 +20,13 @@
 """
 
 import argparse
+import functools
 import os
-import glob
 
 from loguru import logger
 
 from pm2024 import PRESENTER_FOLDER_PATH, PRESENTER_CROP_FOLDER_PATH
-from pisameet.raster import crop_to_face
+from pisameet.raster import crop_to_face, crop_to_face_batch, up_to_date
 
 
 PARSER = argparse.ArgumentParser()
@@ -35,6 +35,8 @@ PARSER.add_argument('--posters', type=int, nargs='+',
 PARSER.add_argument('--target_height', type=int, default=132,
     help='target height for the output png')
 PARSER.add_argument('--overwrite', action='store_true')
+PARSER.add_argument('--jobs', type=int, default=None,
+    help='number of worker processes (defaults to the number of cores)')
 
 
 _CUSTOM_BBOX_DICT = {
@@ -51,25 +53,70 @@ _CUSTOM_BBOX_DICT = {
 }
 
 
-def crop_presenter_pics(target_height, overwrite: bool = False):
-    """Process all the presenter pics.
+@functools.lru_cache(maxsize=1)
+def _presenter_pics() -> dict:
+    """Scan the presenter folder once and return a dictionary mapping the poster
+    ids to the (path, modification time) of the corresponding (original)
+    presenter pics.
     """
-    for input_file_path in glob.glob(os.path.join(PRESENTER_FOLDER_PATH, '*.*')):
-        file_name = os.path.basename(input_file_path)
-        poster_id = int(file_name.split('.')[0])
-        output_file_path = os.path.join(PRESENTER_CROP_FOLDER_PATH, f'{poster_id:03}.png')
-        bbox = _CUSTOM_BBOX_DICT.get(poster_id)
-        crop_to_face(input_file_path, output_file_path, target_height, overwrite, bbox)
+    pics = {}
+    with os.scandir(PRESENTER_FOLDER_PATH) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or '.' not in entry.name or not entry.is_file():
+                continue
+            pics[int(entry.name.split('.')[0])] = entry.path, entry.stat().st_mtime
+    return pics
 
 
-def crop_presenter_pic(poster_id: int, target_height, overwrite: bool = False):
-    """Process a single presenter pic.
+def _cropped_pic_mtimes() -> dict:
+    """Scan the output folder once and return a dictionary mapping the names of
+    the cropped pics to their modification time.
+
+    Note a missing output folder (e.g., at the first run) is treated as empty.
+    """
+    try:
+        with os.scandir(PRESENTER_CROP_FOLDER_PATH) as entries:
+            return {entry.name: entry.stat().st_mtime for entry in entries}
+    except FileNotFoundError:
+        return {}
+
+
+def _crop_task(poster_id: int, input_file_path: str, target_height, overwrite: bool = False):
+    """Return the arguments to crop_to_face() for a given presenter pic.
     """
-    candidates = glob.glob(os.path.join(PRESENTER_FOLDER_PATH, f'{poster_id:03}.*'))
-    input_file_path = os.path.join(PRESENTER_FOLDER_PATH, candidates[0])
     output_file_path = os.path.join(PRESENTER_CROP_FOLDER_PATH, f'{poster_id:03}.png')
     bbox = _CUSTOM_BBOX_DICT.get(poster_id)
-    crop_to_face(input_file_path, output_file_path, target_height, overwrite, bbox)
+    return input_file_path, output_file_path, target_height, overwrite, bbox
+
+
+def crop_presenter_pics(target_height, overwrite: bool = False, jobs: int = None):
+    """Process all the presenter pics (in parallel).
+
+    Both folders are listed once, and the pics that are already cropped (and
+    up to date) are skipped before the tasks are dispatched to the worker processes.
+    """
+    present = {} if overwrite else _cropped_pic_mtimes()
+    tasks = []
+    for poster_id, (input_file_path, input_mtime) in _presenter_pics().items():
+        task = _crop_task(poster_id, input_file_path, target_height, overwrite)
+        file_name = os.path.basename(task[1])
+        if file_name in present and up_to_date(*task[:2], input_mtime, present[file_name]):
+            logger.info(f'Output file {file_name} is up to date, skipping...')
+            continue
+        tasks.append(task)
+    os.makedirs(PRESENTER_CROP_FOLDER_PATH, exist_ok=True)
+    crop_to_face_batch(tasks, jobs)
+
+
+def crop_presenter_pic(poster_id: int, target_height, overwrite: bool = False):
+    """Process a single presenter pic.
+    """
+    try:
+        input_file_path, _ = _presenter_pics()[poster_id]
+    except KeyError:
+        logger.error(f'No presenter pic found for poster {poster_id}.')
+        return
+    crop_to_face(*_crop_task(poster_id, input_file_path, target_height, overwrite))
 
 
 
@@ -77,7 +124,7 @@ def crop_presenter_pic(poster_id: int, target_height, overwrite: bool = False):
 if __name__ == '__main__':
     args = PARSER.parse_args()
     if args.posters is None:
-        crop_presenter_pics(args.target_height, args.overwrite)
+        crop_presenter_pics(args.target_height, args.overwrite, args.jobs)
     else:
         for poster_id in args.posters:
             crop_presenter_pic(poster_id, args.target_height, args.overwrite)
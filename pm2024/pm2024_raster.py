@@ -38,6 +38,10 @@ PARSER.add_argument('--intermediate_width', type=int, default=4240,
     help='intermediate width')
 PARSER.add_argument('--autocrop', action='store_true')
 PARSER.add_argument('--overwrite', action='store_true')
+PARSER.add_argument('--jobs', type=int, default=1,
+    help='number of worker processes for rastering')
+PARSER.add_argument('--optimize', action='store_true',
+    help='losslessly recompress the output png files at the end (requires oxipng)')
 
 
 _AUTOCROP_LIST = [1, 23, 29, 60, 66, 87, 88, 100, 110, 111, 114, 116, 129, 139, 184, 189, 191,
@@ -47,29 +51,56 @@ _AUTOCROP_LIST = [1, 23, 29, 60, 66, 87, 88, 100, 110, 111, 114, 116, 129, 139,
 
 
 
-def raster_poster(poster_id: int, target_width: int, intermediate_width: int, output_folder: str,
+def _raster_args(poster_id: int, target_width: int, intermediate_width: int, output_folder: str,
     overwrite: bool = False, autocrop: bool = False):
-    """
+    """Return the arguments to raster_pdf() for a given poster.
     """
     poster_name = f'{poster_id:03}'
     input_file_path = os.path.join(POSTER_FOLDER_PATH, f'{poster_name}.pdf')
     output_file_path = os.path.join(output_folder, f'{poster_name}.png')
     if poster_id in _AUTOCROP_LIST:
         autocrop = True
-    raster.raster_pdf(input_file_path, output_file_path, target_width,
-        intermediate_width, overwrite, autocrop)
+    return input_file_path, output_file_path, target_width, intermediate_width, overwrite, autocrop
+
+
+def raster_poster(poster_id: int, target_width: int, intermediate_width: int, output_folder: str,
+    overwrite: bool = False, autocrop: bool = False):
+    """
+    """
+    raster.raster_pdf(*_raster_args(poster_id, target_width, intermediate_width,
+        output_folder, overwrite, autocrop))
+
+
+def raster_posters(poster_ids, target_width: int, intermediate_width: int, output_folder: str,
+    overwrite: bool = False, autocrop: bool = False, jobs: int = 1):
+    """Raster a list of posters, possibly in parallel.
+
+    Unless overwrite is True, the posters whose png file is newer than the
+    original pdf are skipped upfront, before any task is dispatched.
+    """
+    if not overwrite:
+        poster_ids = [poster_id for poster_id in poster_ids \
+            if not raster.up_to_date(*_raster_args(poster_id, target_width,
+            intermediate_width, output_folder)[:2])]
+    if jobs > 1:
+        raster.raster_pdfs((_raster_args(poster_id, target_width, intermediate_width,
+            output_folder, overwrite, autocrop) for poster_id in poster_ids), jobs)
+        return
+    for poster_id in poster_ids:
+        raster_poster(poster_id, target_width, intermediate_width, output_folder,
+            overwrite, autocrop)
 
 
 
 if __name__ == '__main__':
     args = PARSER.parse_args()
     if args.posters is None:
-        for file_path in crawl(POSTER_FOLDER_PATH):
-            file_name = os.path.basename(file_path)
-            poster_id = int(file_name.replace('.pdf', ''))
-            raster_poster(poster_id, args.target_width, args.intermediate_width,
-                args.output_folder, args.overwrite, args.autocrop)
+        file_list = crawl(POSTER_FOLDER_PATH)
+        poster_ids = [int(os.path.basename(file_path).replace('.pdf', '')) \
+            for file_path in file_list]
     else:
-        for poster_id in args.posters:
-            raster_poster(poster_id, args.target_width, args.intermediate_width,
-                args.output_folder, args.overwrite, args.autocrop)
+        poster_ids = args.posters
+    raster_posters(poster_ids, args.target_width, args.intermediate_width,
+        args.output_folder, args.overwrite, args.autocrop, args.jobs)
+    if args.optimize:
+        raster.optimize_pngs(args.output_folder)
@@ -17,38 +17,110 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import hashlib
 import os
+import re
+import shutil
 import subprocess
 
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
 __ROOT = os.path.dirname(os.path.abspath(__file__))
 
 
 TEMPLATE_PATH = os.path.join(__ROOT, 'poster_template.tex')
+CLASS_PATH = os.path.join(__ROOT, 'pmposter.cls')
+# Cache of the output png files, indexed by the hash of the latex input.
+CACHE_FOLDER_PATH = os.path.join(__ROOT, '.cache')
+
+
+def _read_template(file_path=TEMPLATE_PATH):
+    """Read the poster template once, and return its content.
+    """
+    with open(file_path, 'r') as input_file:
+        return input_file.read()
+
+
+_TEMPLATE = _read_template()
+_CLASS = _read_template(CLASS_PATH)
+_SCREEN_ID_PATTERN = re.compile(r'^\\newcommand\{\\screenid\}.*$', re.MULTILINE)
+_POSTER_ID_PATTERN = re.compile(r'^\\newcommand\{\\posterid\}.*$', re.MULTILINE)
+
+
+def _pdf_to_png(src, dest):
+    """Convert the (single-page) pdf output of latex to a png file.
+
+    This is done in process with pypdfium2, if available, and through convert
+    otherwise (both at the default 72 dpi).
+    """
+    if pypdfium2 is None:
+        subprocess.run(['convert', src, dest], check=True)
+        return
+    document = pypdfium2.PdfDocument(src)
+    try:
+        document[0].render().to_pil().save(dest)
+    finally:
+        document.close()
 
 
 def create_poster(screen_id, poster_id):
     """
     """
     tex_file_path = os.path.join(__ROOT, f'{screen_id:02d}_{poster_id:02d}_poster.tex')
+    text = _SCREEN_ID_PATTERN.sub(lambda match: '\\newcommand{\\screenid}{%d}' % screen_id,
+        _TEMPLATE)
+    text = _POSTER_ID_PATTERN.sub(lambda match: '\\newcommand{\\posterid}{%d}' % poster_id, text)
+    # If nothing changed in the latex input (i.e., the template and the class
+    # file) since the last run, we just copy the cached output over. Note the
+    # figures are not part of the hash---clear the cache if you change them.
+    key = hashlib.blake2b((_CLASS + text).encode(), digest_size=16).hexdigest()
+    cache_file_path = os.path.join(CACHE_FOLDER_PATH, f'{key}.png')
+    dest = tex_file_path.replace('.tex', '.png')
+    if os.path.exists(cache_file_path):
+        shutil.copyfile(cache_file_path, dest)
+        return
     with open(tex_file_path, 'w') as tex_file:
-        for line in open(TEMPLATE_PATH, 'r'):
-            if line.startswith(r'\newcommand{\screenid}'):
-                line = '\\newcommand{\\screenid}{%d}\n' % screen_id
-            if line.startswith(r'\newcommand{\posterid}'):
-                line = '\\newcommand{\\posterid}{%d}\n' % poster_id
-            tex_file.write(line)
-    subprocess.call(['pdflatex', tex_file_path])
-    subprocess.call(['pdflatex', tex_file_path])
-    subprocess.call(['rm', tex_file_path])
-    subprocess.call(['rm', tex_file_path.replace('.tex', '.aux')])
-    subprocess.call(['rm', tex_file_path.replace('.tex', '.log')])
+        tex_file.write(text)
+    # Remove any stale output from previous runs, so that we never convert (and
+    # cache) a pdf file that was not produced by this very compilation.
     src = tex_file_path.replace('.tex', '.pdf')
-    dest = tex_file_path.replace('.tex', '.png')
-    subprocess.call(['convert', src, dest])
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(src)
+    # Note the two passes are needed, since the class uses tikz pictures with
+    # the remember picture option.
+    cmd = ['pdflatex', '-interaction=nonstopmode', '-halt-on-error', tex_file_path]
+    success = all(subprocess.run(cmd).returncode == 0 for _ in range(2))
+    for file_path in (tex_file_path, tex_file_path.replace('.tex', '.aux'),
+        tex_file_path.replace('.tex', '.log')):
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(file_path)
+    if not success:
+        print(f'pdflatex failed for {tex_file_path}, skipping...')
+        return
+    _pdf_to_png(src, dest)
+    os.makedirs(CACHE_FOLDER_PATH, exist_ok=True)
+    shutil.copyfile(dest, cache_file_path)
+
+
+def create_posters(screen_ids, poster_ids, max_workers=None):
+    """Create all the posters for the given screens in parallel.
+
+    The latex runs for the different posters are independent from each other
+    (each one has its own set of files), and all the actual work happens in
+    external processes, so a pool of threads is enough to run them in parallel.
+    """
+    pairs = [(screen_id, poster_id) for screen_id in screen_ids for poster_id in poster_ids]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Note we need to consume the iterator in order for the exceptions
+        # in the workers (if any) to be propagated.
+        list(executor.map(create_poster, *zip(*pairs)))
 
 
 
 if __name__ == '__main__':
-    for screen in (1, 2):
-        for poster in (0, 1, 2, 3):
-            create_poster(screen, poster)
+    create_posters((1, 2), (0, 1, 2, 3))